@@ -1,3 +1,14 @@
+import sys
+import functools
+
+
+@functools.lru_cache(maxsize=512)
+def _lowered_key(key):
+    # interned keys let dict lookups short-circuit on identity before
+    # falling back to a character-wise comparison
+    return sys.intern(key.lower())
+
+
 class CaseInsensitiveDict(dict):
     """The spec in https://datatracker.ietf.org/doc/html/rfc2616#section-4.2 states:
 
@@ -14,12 +25,16 @@ class CaseInsensitiveDict(dict):
 
     @staticmethod
     def _k(key):
-        return key.lower() if isinstance(key, str) else key
+        return _lowered_key(key) if isinstance(key, str) else key
 
     def _convert_keys(self):
-        for k in list(self.keys()):
-            v = super().pop(k)
-            self.__setitem__(k, v)
+        # probe over the key view allocates nothing in the common case of
+        # keys that are already lowercase
+        if not any(type(k) is str and not k.islower() for k in self):
+            return
+        items = [(self._k(k), v) for k, v in super().items()]
+        super().clear()
+        super().update(items)
 
     def __getitem__(self, key):
         return super().__getitem__(self._k(key))
@@ -42,9 +57,18 @@ class CaseInsensitiveDict(dict):
     def setdefault(self, key, *args, **kwargs):
         return super().setdefault(self._k(key), *args, **kwargs)
 
-    def update(self, E={}, **F):
-        super().update(self.__class__(E))
-        super().update(self.__class__(**F))
+    def update(self, E=None, **F):
+        # setting items directly lowercases each key exactly once and skips
+        # the intermediate CaseInsensitiveDict constructions
+        if E:
+            items = E.items() if hasattr(E, "items") else E
+            for k, v in items:
+                self[k] = v
+        for k, v in F.items():
+            self[k] = v
+
+
+_BOOL_HEADER_VALUES = {"true": True, "false": False}
 
 
 class HttpHeaders(CaseInsensitiveDict):
@@ -54,10 +78,10 @@ class HttpHeaders(CaseInsensitiveDict):
 
     def cast_headers(self, headers):
         for k, v in headers.items():
-            if isinstance(headers[k], str):
-                if headers[k].lower() == "true":
-                    headers[k] = True
-                elif headers[k].lower() == "false":
-                    headers[k] = False
-            elif isinstance(headers[k], dict):
-                self.cast_headers(headers[k])
+            if type(v) is str:
+                try:
+                    headers[k] = _BOOL_HEADER_VALUES[v.lower()]
+                except KeyError:
+                    pass
+            elif type(v) is dict:
+                self.cast_headers(v)
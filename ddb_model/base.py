@@ -1,12 +1,25 @@
+import sys
+import json
 import math
-import zlib
-import copy
 import time
 import random
 import base64
-import pickle
-import threading
-from typing import List
+import string
+import decimal
+import operator
+import functools
+import itertools
+from concurrent import futures
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 import boto3.dynamodb.conditions as conditions
 
@@ -14,7 +27,7 @@ from .. import logging
 from .. import constants
 
 
-BARRIER_DEFAULT_TIMEOUT = 900
+MAX_PARALLEL_SHARD_WORKERS = 10
 SHARDS_RANGE_ARTICLE = range(0, 10)
 SHARDS_RANGE_ARTICLE_RELEASE = range(0, 10)
 SHARDS_RANGE_ARTICLE_SUPPLY_CHAIN = range(0, 10)
@@ -22,21 +35,48 @@ SHARDS_RANGE_ARTICLE_TYPE = range(0, 3)
 
 logger = logging.getLogger(__name__)
 
+# interned copy - lookups against interned index and sort key names
+# short-circuit on identity before any character comparison
+INDEX_NAME_SORT_KEY_MAPPING = {
+    sys.intern(index_name): sys.intern(sort_key_name)
+    for index_name, sort_key_name in constants.INDEX_NAME_SORT_KEY_MAPPING.items()
+}
+
 
 class EmptyValue:
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _template_field_names(template: str) -> tuple:
+    """Index key templates are a small fixed set, so their format fields are
+    parsed once instead of on every formatting call.
+    """
+    return tuple(field_name for _, field_name, _, _ in string.Formatter().parse(template) if field_name)
+
+
 class SharedTableAccess:
+    # names computed once per (access class, table class) pair - the dir()
+    # scan over a boto3-backed table is too expensive to repeat per request
+    _inheritable_method_names = {}
+
     def __init__(self, table_class, force_reload=False):
         self._shared_table = table_class(force_reload)
         self._inherit_public_methods_of_shared_table()
 
     def _inherit_public_methods_of_shared_table(self):
-        for name in dir(self._shared_table):
-            obj = getattr(self._shared_table, name)
-            if not name.startswith("_") and callable(obj) and name not in dir(self):
-                setattr(self, name, obj)
+        cache_key = (type(self), type(self._shared_table))
+        names = self._inheritable_method_names.get(cache_key)
+        if names is None:
+            own_names = set(dir(self))
+            names = tuple(
+                name
+                for name in dir(self._shared_table)
+                if not name.startswith("_") and name not in own_names and callable(getattr(self._shared_table, name))
+            )
+            self._inheritable_method_names[cache_key] = names
+        for name in names:
+            setattr(self, name, getattr(self._shared_table, name))
 
     def select_table(self, name):
         if not getattr(self._shared_table, "table", None):
@@ -75,7 +115,9 @@ class IndexMapping:
     """
 
     def enrich_entity_with_index_keys(self, entity):
-        enriched_entity = copy.deepcopy(entity)
+        # only top-level index keys are added, nested values stay untouched,
+        # so a shallow copy is sufficient and avoids the deepcopy walk
+        enriched_entity = dict(entity)
         for index_key, template in self.index_keys_map.items():
             value = self._value_from_template(index_key, template, enriched_entity)
             if not isinstance(value, EmptyValue):
@@ -83,7 +125,7 @@ class IndexMapping:
         return enriched_entity
 
     def drop_index_keys_from_entity(self, entity):
-        svelte_entity = copy.deepcopy(entity)
+        svelte_entity = dict(entity)
         for index_key in self.index_keys_map:
             svelte_entity.pop(index_key, None)
         return svelte_entity
@@ -115,59 +157,106 @@ class IndexMapping:
         Returns:
             Formatted string or EmptyValue.
         """
-        try:
-            return template.format(**data) or EmptyValue()
-        except KeyError:
+        if any(field_name not in data for field_name in _template_field_names(template)):
             return EmptyValue()
+        return template.format_map(data) or EmptyValue()
+
+
+_SHARD_POOL = futures.ThreadPoolExecutor(max_workers=MAX_PARALLEL_SHARD_WORKERS, thread_name_prefix="shard")
+
+# only pagination cursors need compression; consumers without the wheel can
+# still import and use everything else, and only cursor handling raises
+if zstandard is not None:
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=1)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+else:
+    _ZSTD_COMPRESSOR = _ZSTD_DECOMPRESSOR = None
+
+if orjson is not None:
+
+    def _cursor_dumps(data, default):
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=default)
 
+    _cursor_loads = orjson.loads
+else:
+    # stdlib json stringifies non-str keys natively and compresses the same
+    def _cursor_dumps(data, default):
+        return json.dumps(data, default=default).encode()
 
-class Barrier:
-    """Running parallel threads consumes provisioned throughput."""
+    _cursor_loads = json.loads
+
+
+class ThreadPoolFanOut:
+    """Running parallel threads consumes provisioned throughput.
+
+    Workers are taken from a shared module-level pool, so the thread-start
+    cost is paid once per container instead of once per request.
+    """
 
     def __init__(self, callable_, kwargs_mapping: dict):
-        """ """
-        barrier_size = len(kwargs_mapping) + 1
-        assert barrier_size < 100
-        self.barrier = threading.Barrier(barrier_size, timeout=BARRIER_DEFAULT_TIMEOUT)
         self.callable = callable_
         self.kwargs_mapping = kwargs_mapping
         self.results = {}
         self.errors = {}
 
-    def threaded_shell(self, id_, kwargs):
-        # start_time = time.perf_counter()
-        self.results[id_] = {}
-        try:
-            self.results[id_] = self.callable(**kwargs)
-        except BaseException as exc:
-            logger.error(f"Error {exc} detected in step {id_}", context_kwargs=kwargs)
-            self.errors[id_] = exc
-        # logger.debug(f'Function {id_} finished within {time.perf_counter()-start_time:3.2f}s.')
-        try:
-            self.barrier.wait()
-        except threading.BrokenBarrierError as exc:
-            logger.error(f"Barrier error {exc} detected in step {id_}", context_kwargs=kwargs)
-            self.errors[id_] = exc
-
     def run(self):
-        start_time = time.perf_counter()
-        for id_, kwargs in self.kwargs_mapping.items():
-            barrier_thread = threading.Thread(
-                name=f"BThread-{id_:02d}",
-                target=self.threaded_shell,
-                args=(id_, kwargs),
-            )
-            barrier_thread.start()
-        self.barrier.wait()
-        logger.debug(f"Barrier penetrated after {time.perf_counter()-start_time:3.2f}s.")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter() if debug_enabled else 0.0
+        submitted = {id_: _SHARD_POOL.submit(self.callable, **kwargs) for id_, kwargs in self.kwargs_mapping.items()}
+        for id_, future in submitted.items():
+            try:
+                self.results[id_] = future.result()
+            except BaseException as exc:
+                logger.error(f"Error {exc} detected in step {id_}", context_kwargs=self.kwargs_mapping[id_])
+                self.errors[id_] = exc
+        if debug_enabled:
+            logger.debug(f"Fan-out finished after {time.perf_counter()-start_time:3.2f}s.")
         return self.results, self.errors
 
 
 class QueryMixin:
+    @property
+    def shard_pk_conditions(self):
+        """Shard range is fixed per model, so the Partition Key conditions are
+        built once per instance instead of once per request.
+        """
+        pk_conditions = getattr(self, "_shard_pk_conditions", None)
+        if pk_conditions is None:
+            pk_conditions = {
+                shard_id: conditions.Key("s_id").eq(sys.intern(str(shard_id))) for shard_id in self.shard_ids
+            }
+            self._shard_pk_conditions = pk_conditions
+        return pk_conditions
+
+    @staticmethod
+    def _encode_decimal(value):
+        # the resource layer hands numbers back as Decimal, which neither
+        # encoder handles natively; integral values round-trip exactly as int,
+        # everything else keeps its full 38-digit precision as a tagged
+        # string - float would silently round past 17 significant digits
+        if isinstance(value, decimal.Decimal):
+            return int(value) if value == value.to_integral_value() else {"__decimal__": str(value)}
+        raise TypeError
+
     @staticmethod
-    def _decompress_exclusive_start_key(key: str) -> List[dict]:
-        exclusive_start_keys_coded = zlib.decompress(base64.b64decode(key))
-        return pickle.loads(exclusive_start_keys_coded)
+    def _decode_key_attribute(value):
+        # key attributes are scalars, so a dict unambiguously marks a tagged
+        # Decimal - the inverse of _encode_decimal
+        if isinstance(value, dict):
+            return decimal.Decimal(value["__decimal__"])
+        return value
+
+    @classmethod
+    def _decompress_exclusive_start_key(cls, key: str) -> dict:
+        if _ZSTD_DECOMPRESSOR is None:
+            raise ModuleNotFoundError("compressed pagination cursors require the zstandard package")
+        exclusive_start_keys_coded = _ZSTD_DECOMPRESSOR.decompress(base64.urlsafe_b64decode(key))
+        return {
+            int(shard_id): {
+                attribute: cls._decode_key_attribute(value) for attribute, value in start_key.items()
+            }
+            for shard_id, start_key in _cursor_loads(exclusive_start_keys_coded).items()
+        }
 
     def _compress_last_evaluated_keys(self, results: dict) -> str:
         last_evaluated_keys = {}
@@ -176,8 +265,10 @@ class QueryMixin:
             last_evaluated_keys[shard_id] = results.get(shard_id, {}).get("LastEvaluatedKey", {})
         if not any(last_evaluated_keys.values()):
             return ""
-        zipped_binary_key = zlib.compress(pickle.dumps(last_evaluated_keys))
-        return base64.b64encode(zipped_binary_key).decode()
+        if _ZSTD_COMPRESSOR is None:
+            raise ModuleNotFoundError("compressed pagination cursors require the zstandard package")
+        zipped_binary_key = _ZSTD_COMPRESSOR.compress(_cursor_dumps(last_evaluated_keys, default=self._encode_decimal))
+        return base64.urlsafe_b64encode(zipped_binary_key).decode()
 
     @staticmethod
     def _log_errors(errors: dict):
@@ -186,12 +277,16 @@ class QueryMixin:
         logger.error(msg)
 
     def _sort_by_and_add_priority(self, items, index_name):
-        sort_key_name = constants.INDEX_NAME_SORT_KEY_MAPPING.get(index_name)
+        sort_key_name = INDEX_NAME_SORT_KEY_MAPPING.get(index_name)
         if items and sort_key_name:
-            for item in items:
-                item["priority"] = item[sort_key_name].split("#")[-1]
             # e.g. channel#100#5_2021.08.10 -> sorting by string: 5_2021.08.10
-            items.sort(key=lambda item: item["priority"])
+            # rpartition avoids the throwaway list split() would allocate, and
+            # decorating up front computes each sort key exactly once
+            decorated = [(item[sort_key_name].rpartition("#")[2], item) for item in items]
+            decorated.sort(key=operator.itemgetter(0))
+            for priority, item in decorated:
+                item["priority"] = priority
+            items[:] = [item for _, item in decorated]
         return items
 
     def query_shards(self, index_name, sk_condition=None, **additional_request_attributes):
@@ -212,8 +307,9 @@ class QueryMixin:
                 int(additional_request_attributes["Limit"]) / len(self.shard_ids)
             )
         kwargs_mapping = {}
+        shard_pk_conditions = self.shard_pk_conditions
         for shard_id in self.shard_ids:
-            pk_condition = conditions.Key("s_id").eq(str(shard_id))
+            pk_condition = shard_pk_conditions[shard_id]
             if exclusive_start_keys_coded:
                 exclusive_start_key = exclusive_start_keys[shard_id]
                 if not exclusive_start_key:
@@ -225,11 +321,10 @@ class QueryMixin:
                 KeyConditionExpression=sk_condition and pk_condition & sk_condition or pk_condition,
                 **additional_request_attributes,
             )
-        results, errors = Barrier(self.query_items, kwargs_mapping).run()
+        results, errors = ThreadPoolFanOut(self.query_items, kwargs_mapping).run()
         if errors:
             self._log_errors(errors)
-        flattened_result = []
-        [flattened_result.extend(value.get("Items", [])) for value in results.values()]
+        flattened_result = list(itertools.chain.from_iterable(value.get("Items", ()) for value in results.values()))
         to_return = {"Items": self._sort_by_and_add_priority(flattened_result, index_name)}
         compressed_last_evaluated_keys = self._compress_last_evaluated_keys(results)
         if compressed_last_evaluated_keys:
@@ -4,13 +4,19 @@ def borg_factory():
         _shared_state = {}
 
         def __init__(self, force_reload=False):
-            if force_reload or time.time() - self._shared_state.get("_start_time", 0) > self.INSTANTIATE_IN_SECONDS:
+            # monotonic clock is immune to NTP adjustments and cheaper to read
+            now = time.monotonic()
+            # monotonic starts near zero at boot, so a missing _start_time must
+            # be detected explicitly rather than defaulted to 0
+            start = self._shared_state.get("_start_time")
+            if force_reload or start is None or now - start > self.INSTANTIATE_IN_SECONDS:
                 # Keep reference on shared state all the time.
                 self._shared_state.clear()
-                self._shared_state["_start_time"] = time.time()
+                self._shared_state["_start_time"] = now
             self.__dict__ = self._shared_state
-            remaining_time = self.INSTANTIATE_IN_SECONDS - time.time() + self.__dict__["_start_time"]
-            logger.debug(f"Shared instance lives further {remaining_time:3.0f} s.")
+            if logger.isEnabledFor(logging.DEBUG):
+                remaining_time = self.INSTANTIATE_IN_SECONDS - now + self._shared_state["_start_time"]
+                logger.debug(f"Shared instance lives further {remaining_time:3.0f} s.")
 
         def clear(self):
             self._shared_state.clear()
@@ -2,9 +2,12 @@
 
 """
 import time
+import random
+import itertools
 import botocore.exceptions
 from boto3.dynamodb.types import TypeDeserializer
 
+from concurrent import futures
 from typing import Dict, List
 
 from . import helpers
@@ -14,7 +17,12 @@ from . import constants
 from .aws import default_client
 
 
+# BatchWriteItem accepts at most 25 requests per call
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_WRITE_MAX_ATTEMPTS = 5
+
 logger = logging.getLogger(__name__)
+_PARALLEL_REQUEST_POOL = futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="dynamodb")
 
 
 class DynamoDBDeserializer(TypeDeserializer):
@@ -24,17 +32,50 @@ class DynamoDBDeserializer(TypeDeserializer):
         try:
             return super().deserialize(value)
         except (AttributeError, TypeError):
-            return {k: self.deserialize(v) for k, v in value.items()}
+            pass
+        # plain mapping - walk it with an explicit stack, which keeps deeply
+        # nested items independent of the recursion limit and avoids a Python
+        # frame per nesting level
+        root = {}
+        stack = [(root, value)]
+        while stack:
+            target, source = stack.pop()
+            for k, v in source.items():
+                if isinstance(v, dict):
+                    try:
+                        target[k] = super().deserialize(v)
+                        continue
+                    except (AttributeError, TypeError):
+                        pass
+                    child = {}
+                    target[k] = child
+                    stack.append((child, v))
+                else:
+                    target[k] = v
+        return root
+
+
+# deserialisation is stateless, share one instance instead of constructing
+# a deserializer per call
+DESERIALIZER = DynamoDBDeserializer()
 
 
 class DynamoDB:
+    # Table wrappers (and with them the pooled keep-alive connections of the
+    # shared resource) are reused across instances and Lambda invocations.
+    _tables_by_name: Dict[str, object] = {}
+
     def select_table(self, table_name: str):
         """Selects a table to be used for further operations.
 
         Args:
             table_name: Name of the table.
         """
-        self.table = default_client().get_resource_dynamodb().Table(table_name)
+        table = self._tables_by_name.get(table_name)
+        if table is None:
+            table = default_client().get_resource_dynamodb().Table(table_name)
+            self._tables_by_name[table_name] = table
+        self.table = table
 
     def get_item(self, consistent_read=True, **primary_key) -> dict:
         """Returns a set of attributes for the item with the given primary key.
@@ -80,41 +121,73 @@ class DynamoDB:
     def put_items(self, items: List[dict]) -> bool:
         """Creates new items, or replaces old items with new items in a batch operation.
 
+        Chunks of 25 items are submitted in parallel; unprocessed items are
+        retried with jittered exponential backoff.
+
         Args:
             items: A list of items.
 
         Returns:
             True if created, else False.
         """
-        try:
-            with self.table.batch_writer() as batch:
-                for item in items:
-                    batch.put_item(Item=item)
-            return True
-        except botocore.exceptions.ClientError as err:
-            logger.error(f"Batch PutItem with {items} failed: {err}.")
-            return False
+        chunks = [items[i : i + BATCH_WRITE_MAX_ITEMS] for i in range(0, len(items), BATCH_WRITE_MAX_ITEMS)]
+        submitted = [_PARALLEL_REQUEST_POOL.submit(self._put_items_chunk, chunk) for chunk in chunks]
+        return all(future.result() for future in futures.as_completed(submitted))
 
-    def scan(self, **request_attributes) -> Dict[str, list]:
+    def _put_items_chunk(self, chunk: List[dict]) -> bool:
+        request_items = {self.table.name: [{"PutRequest": {"Item": item}} for item in chunk]}
+        for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+            try:
+                response = self.table.meta.client.batch_write_item(RequestItems=request_items)
+            except botocore.exceptions.ClientError as err:
+                logger.error(f"Batch PutItem with {chunk} failed: {err}.")
+                return False
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                return True
+            time.sleep(random.uniform(0, 2**attempt * 0.05))
+        logger.error(f"Batch PutItem left unprocessed items after {BATCH_WRITE_MAX_ATTEMPTS} attempts.")
+        return False
+
+    def scan(self, total_segments=4, **request_attributes) -> Dict[str, list]:
         """Gets all items from DynamoDB table matching criteria.
 
+        Uses DynamoDB's native parallel scan: the table is split into
+        total_segments segments which are paginated concurrently.
+
         Args:
+            total_segments: Number of concurrently scanned segments.
             request_attributes: Partition and sort keys, filters, etc.
         """
-        has_more = True
+        if total_segments <= 1:
+            return {"Items": self._scan_segment(dict(request_attributes))}
+        submitted = [
+            _PARALLEL_REQUEST_POOL.submit(
+                self._scan_segment, dict(request_attributes, Segment=segment, TotalSegments=total_segments)
+            )
+            for segment in range(total_segments)
+        ]
+        items = []
+        for future in submitted:
+            items.extend(future.result())
+        return {"Items": items}
+
+    def _scan_segment(self, request_attributes: dict) -> list:
         items = []
+        has_more = True
         while has_more:
-            response = self.table.scan(**request_attributes)
             try:
-                items += response.get("Items", [])
+                response = self.table.scan(**request_attributes)
             except botocore.exceptions.ClientError as err:
                 logger.error(f"DynamoDB Scan with {request_attributes} failed: {err}.")
+                return items
 
+            items.extend(response.get("Items", []))
             if response.get("LastEvaluatedKey"):
                 request_attributes["ExclusiveStartKey"] = response["LastEvaluatedKey"]
             else:
                 has_more = False
-        return {"Items": items}
+        return items
 
     def delete_item(self, **primary_key) -> bool:
         """Deletes item from DynamoDB Table.
@@ -194,10 +267,12 @@ class DynamoDB:
         Returns:
             List with the requested items.
         """
-        start_time = time.perf_counter()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter() if debug_enabled else 0.0
         max_pages = request_attributes.pop("MaxPages", constants.DYNAMO_DB_MAX_QUERY_PAGES)
         start_key = request_attributes.get("ExclusiveStartKey", True)
         result = {"Items": [], "Counts": []}
+        pages = []
         iterations = 0
         while start_key:
             iterations += 1
@@ -207,17 +282,20 @@ class DynamoDB:
                 query_response = self.table.query(**request_attributes)
             except botocore.exceptions.ClientError as err:
                 logger.error(f"Query with {request_attributes} failed: {err}.")
-                return result
+                break
 
-            result["Items"].extend(query_response.pop("Items", []))
+            pages.append(query_response.pop("Items", []))
             result["Counts"].append(query_response["Count"])
             result.pop(
                 "LastEvaluatedKey", None
             )  # in last page the key is not present in response, make sure to clean it up also from previous iteration
             result.update(query_response)
             if iterations >= max_pages:
-                logger.debug(f"Item Count(s): {result.get('Counts')}, duration {time.perf_counter()-start_time:3.2f}s")
-                return result
+                break
             start_key = query_response.get("LastEvaluatedKey")
-        logger.debug(f"Item Count(s): {result.get('Counts')}, duration {time.perf_counter()-start_time:3.2f}s")
+        # flattening once at the end allocates the item list at its final size
+        # instead of growing and re-copying it on every page
+        result["Items"] = list(itertools.chain.from_iterable(pages))
+        if debug_enabled:
+            logger.debug(f"Item Count(s): {result.get('Counts')}, duration {time.perf_counter()-start_time:3.2f}s")
         return result
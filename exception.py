@@ -6,14 +6,40 @@ Functions:
 
 """
 
+import io
 import json
 import functools
 import traceback
 from http import HTTPStatus
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 NOT_PROD = 1
 
+# cloud watch log streams posts only one-liners
+_NEWLINE_ESCAPE_TABLE = str.maketrans({"\n": "\\n"})
+_splunk = None
+
+
+def _get_splunk():
+    # imported lazily to keep module load free of the splunk dependency chain
+    global _splunk
+    if _splunk is None:
+        from . import splunk
+
+        _splunk = splunk
+    return _splunk
+
+
+def _dump_body(body) -> str:
+    if orjson is not None:
+        return orjson.dumps(body).decode()
+    return json.dumps(body)
+
 
 class InvalidProtocolError(Exception):
     """Exception raised for invalid protocol values.
@@ -80,14 +106,15 @@ class SQSBatchProcessingError(Exception):
     # Overriding this method so we can output all child exception tracebacks when we raise this exception to prevent
     # errors being lost. See https://github.com/awslabs/aws-lambda-powertools-python/issues/275
     def __str__(self):
-        parent_exception_str = super(SQSBatchProcessingError, self).__str__()
-        exception_list = [f"{parent_exception_str}\n"]
-        for exception in self.child_exceptions:
-            extype, ex, tb = exception
-            formatted = "".join(traceback.format_exception(extype, ex, tb))
-            exception_list.append(formatted)
-
-        return "\n".join(exception_list)
+        # tracebacks are printed straight into one buffer instead of building
+        # a per-frame string list per child and joining twice
+        buf = io.StringIO()
+        buf.write(super(SQSBatchProcessingError, self).__str__())
+        buf.write("\n")
+        for extype, ex, tb in self.child_exceptions:
+            buf.write("\n")
+            traceback.print_exception(extype, ex, tb, file=buf)
+        return buf.getvalue()
 
 
 def lambda_exception_handler(logger=None, reraise_as=None):
@@ -97,9 +124,11 @@ def lambda_exception_handler(logger=None, reraise_as=None):
             try:
                 return func(*args, **kwargs)
             except Exception as err:
-                message = f"{type(err).__name__} was raised: {err} when calling {func.__name__}"
-                # cloud watch log streams posts only one-liners
-                traceback_formatted = ("".join(traceback.format_tb(err.__traceback__))).replace("\n", "\\n")
+                error_description = f"{type(err).__name__} was raised: {err}"
+                message = f"{error_description} when calling {func.__name__}"
+                traceback_formatted = "".join(traceback.format_tb(err.__traceback__)).translate(
+                    _NEWLINE_ESCAPE_TABLE
+                )
                 if reraise_as:
                     if logger:
                         logger.warning(
@@ -113,25 +142,28 @@ def lambda_exception_handler(logger=None, reraise_as=None):
                 }
                 if NOT_PROD:
                     status_code["traceback"] = traceback_formatted
-                message = f"{type(err).__name__} was raised: {err}, traceback: {traceback_formatted}"
+                message_with_traceback = f"{error_description}, traceback: {traceback_formatted}"
                 to_return = {
                     "statusCode": int(HTTPStatus.INTERNAL_SERVER_ERROR),
-                    "body": json.dumps({"statusCode": status_code}),
+                    "body": _dump_body({"statusCode": status_code}),
                 }
 
                 if logger:
                     logger.exception(
-                        message,
+                        message_with_traceback,
                         context_fnc_params={"args": args, "kwargs": kwargs},
                         tag_fnc_name=func.__name__,
                     )
 
-                from . import splunk
-
+                splunk = _get_splunk()
                 splunk.EventCollector(args[0], context=args[1]).send_message(
-                    error=message,
+                    error=message_with_traceback,
                     statusCode=to_return["statusCode"],
                 )
+                # the execution environment freezes (or is reaped) right after
+                # the handler returns, so atexit may never run - push the error
+                # report out before handing back control
+                splunk._flush_pending_messages()
                 return to_return
 
         return wrapper
@@ -12,10 +12,17 @@ returned by AWS's lambda function
 
 
 import json
-import copy
+import decimal
+import inspect
 from http import HTTPStatus
 
-from functools import wraps
+from functools import wraps, partial
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import logging
 from .helpers import JSONEncoder
 
@@ -34,183 +41,182 @@ STATUS_TYPE_UNPROCESSABLE_ENTITY = "unprocessable_entity"
 
 logger = logging.getLogger(__name__)
 
+# orjson only consults the default callable for types it cannot serialise
+# natively, so the per-value Python dispatch of the stdlib encoder disappears
+_json_encoder_default = JSONEncoder().default
 
-def generate_response(type_, message):
-    """Base method generating a response
-
-    Args:
-        type_ (str): type of response
-        message (str): additional response message
-
-    Returns:
-        ElementResponse: formatted response
+# exact-type dispatch - one hash lookup on type(obj) instead of walking an
+# isinstance chain; anything unknown falls through to the helpers encoder
+_JSON_TYPE_ENCODERS = {
+    set: list,
+    frozenset: list,
+    decimal.Decimal: str,
+}
 
-    """
-    return ElementResponse(StatusCode(type_, message))
 
+def _json_default(obj):
+    try:
+        return _JSON_TYPE_ENCODERS[type(obj)](obj)
+    except KeyError:
+        return _json_encoder_default(obj)
 
-def generate_ok_response(message=""):
-    """Creates an element response with Status OK
 
-    Args:
-        message (str): additional response message
-
-    Returns:
-        ElementResponse: formatted response
-
-    """
-    return generate_response(STATUS_TYPE_OK, message)
-
-
-def generate_created_response(message=""):
-    """Creates an element response with Status Created
-
-    Args:
-        message (str): additional response message
-
-    Returns:
-        ElementResponse: formatted response
-
-    """
-    return generate_response(STATUS_TYPE_CREATED, message)
-
-
-def generate_accepted_response(message=""):
-    """Creates an element response with Status Created
+def generate_response(type_, message=""):
+    """Base method generating a response
 
     Args:
+        type_ (str): type of response
         message (str): additional response message
 
     Returns:
         ElementResponse: formatted response
 
     """
-    return generate_response(STATUS_TYPE_ACCEPTED, message)
-
-
-def generate_not_found_response(message=""):
-    """Creates an element response with Status Not found
+    return ElementResponse(StatusCode(type_, message))
 
-    Args:
-        message (str): additional response message
 
-    Returns:
-        ElementResponse: formatted response
+# the per-type helpers are partial applications of generate_response - same
+# (message="") signature, one Python frame less per response creation
+generate_ok_response = partial(generate_response, STATUS_TYPE_OK)
+generate_created_response = partial(generate_response, STATUS_TYPE_CREATED)
+generate_accepted_response = partial(generate_response, STATUS_TYPE_ACCEPTED)
+generate_not_found_response = partial(generate_response, STATUS_TYPE_NOT_FOUND)
+generate_bad_request_response = partial(generate_response, STATUS_TYPE_BAD_REQUEST)
+generate_not_implemented_response = partial(generate_response, STATUS_TYPE_NOT_IMPLEMENTED)
+generate_internal_server_error_response = partial(generate_response, STATUS_TYPE_INTERNAL_SERVER_ERROR)
+generate_unprocessable_entity_response = partial(generate_response, STATUS_TYPE_UNPROCESSABLE_ENTITY)
+generate_unauthorized_response = partial(generate_response, STATUS_TYPE_UNAUTHORIZED)
+generate_forbidden_response = partial(generate_response, STATUS_TYPE_FORBIDDEN)
 
-    """
-    return generate_response(STATUS_TYPE_NOT_FOUND, message)
 
+def _handle_tuple_result(func, result):
+    if len(result) != 2:
+        raise RuntimeError(f"Wrapped callable {func} returning tuple wih {len(result)} elements")
+    response_dict, status_inst = result
+    return response_dict, status_inst
 
-def generate_bad_request_response(message=""):
-    """Creates an element response with Status Bas Request
 
-    Args:
-        message (str): additional response message
+def _handle_element_response_result(func, result):
+    # this is legitimate, improves readability
+    logger.debug("Calling generate decorator multiple times")
+    return result.get_content(), result.status
 
-    Returns:
-        ElementResponse: formatted response
 
-    """
-    return generate_response(STATUS_TYPE_BAD_REQUEST, message)
+def _handle_status_code_result(func, result):
+    return {}, result
 
 
-def generate_not_implemented_response(message=""):
-    """Creates an element response with Status Not Implemented
+def _handle_dict_result(func, result):
+    return result, StatusCode().set_ok()
 
-    Args:
-        message (str): additional response message
 
-    Returns:
-        ElementResponse: formatted response
+def _handle_unknown_result(func, result):
+    # subclasses of the handled types miss the exact-type fast path but still
+    # dispatch correctly here; dict is deliberately last since ElementResponse
+    # and StatusCode both derive from it
+    for result_type, handler in _RESULT_HANDLERS.items():
+        if isinstance(result, result_type):
+            return handler(func, result)
+    raise RuntimeError(f"Wrapped callable {func} returns unknown type {type(result)}")
 
-    """
-    return generate_response(STATUS_TYPE_NOT_IMPLEMENTED, message)
 
+def generate(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        # single hash lookup on the exact result type replaces the isinstance
+        # chain walked on every decorated call
+        handler = _RESULT_HANDLERS.get(type(result), _handle_unknown_result)
+        response_dict, status_inst = handler(func, result)
+        return ElementResponse(status_inst, _content=response_dict)
 
-def generate_internal_server_error_response(message=""):
-    """Creates an element response with Status Server Error
+    return wrapper
 
-    Args:
-        message (str): additional response message
 
-    Returns:
-        ElementResponse: formatted response
+def generate_fast(func):
+    """Codegen variant of :func:`generate` for hot call paths
 
+    Compiles, at decoration time, a wrapper whose parameter list mirrors the
+    wrapped callable, so every call skips the ``*args``/``**kwargs`` packing
+    and unpacking the generic wrapper pays. Signatures the codegen cannot
+    mirror (keyword-only, var-positional, ...) fall back to :func:`generate`.
     """
-    return generate_response(STATUS_TYPE_INTERNAL_SERVER_ERROR, message)
-
-
-def generate_unprocessable_entity_response(message=""):
-    """Creates an Element Response with a status of Unprocessable Entity"""
-    return generate_response(STATUS_TYPE_UNPROCESSABLE_ENTITY, message)
+    try:
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return generate(func)
+    if any(param.kind is not param.POSITIONAL_OR_KEYWORD for param in parameters):
+        return generate(func)
+
+    env = {
+        "_func": func,
+        "_handlers_get": _RESULT_HANDLERS.get,
+        "_handle_unknown_result": _handle_unknown_result,
+        "_ElementResponse": ElementResponse,
+        "type": type,
+    }
+    declaration = []
+    for index, param in enumerate(parameters):
+        if param.default is param.empty:
+            declaration.append(param.name)
+        else:
+            env[f"_default{index}"] = param.default
+            declaration.append(f"{param.name}=_default{index}")
+    call = ", ".join(param.name for param in parameters)
+    source = (
+        f"def wrapper({', '.join(declaration)}):\n"
+        f"    result = _func({call})\n"
+        f"    handler = _handlers_get(type(result), _handle_unknown_result)\n"
+        f"    response_dict, status_inst = handler(_func, result)\n"
+        f"    return _ElementResponse(status_inst, _content=response_dict)\n"
+    )
+    exec(source, env)
+    return wraps(func)(env["wrapper"])
 
 
-def generate_unauthorized_response(message=""):
-    """Creates an element response with Status Unauthorized
-    Args:
-        message (str): additional response message
-
-    Returns:
-        ElementResponse: formatted response
+class StatusCode(dict):
+    """Base class that all StatusCode operations derive from
+    Inherits standard HTTPStatus codes and enables to provide additional message.
 
     """
-    return generate_response(STATUS_TYPE_UNAUTHORIZED, message)
 
+    # dict provides the payload storage at C level; slots drop the per-instance
+    # __dict__ that would otherwise only carry these two attributes
+    __slots__ = ("_code", "_desc")
 
-def generate_forbidden_response(message=""):
-    """Creates an element response with Status Forbidden
-    Args:
-        message (str): additional response message
+    _interned_statuses = {}
 
-    Returns:
-        ElementResponse: formatted response
-
-    """
-    return generate_response(STATUS_TYPE_FORBIDDEN, message)
+    @classmethod
+    def intern(cls, type_):
+        """Returns a shared instance for the given status type.
 
+        Hot default paths create the same messageless status over and over;
+        interning hands out one instance per type instead. The returned
+        instance is shared across callers and must be treated as read-only.
 
-def generate(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        result = func(*args, **kwargs)
-        if isinstance(result, tuple):
-            if len(result) == 2:
-                response_dict, status_inst = result
-            else:
-                raise RuntimeError(f"Wrapped callable {func} returning tuple wih {len(result)} elements")
-        elif isinstance(result, ElementResponse):
-            # this is legitimate, improves readability
-            logger.debug("Calling generate decorator multiple times")
-            status_inst = result.status
-            response_dict = result.get_content()
-        elif isinstance(result, StatusCode):
-            status_inst = result
-            response_dict = {}
-        elif isinstance(result, dict):
-            status_inst = StatusCode().set_ok()
-            response_dict = result
-        else:
-            raise RuntimeError(f"Wrapped callable {func} returns unknown type {type(result)}")
-        return ElementResponse(status_inst, **response_dict)
-
-    return wrapper
-
+        Args:
+            type_ (str): type of status, e.g. "ok"
 
-class StatusCode(dict):
-    """Base class that all StatusCode operations derive from
-    Inherits standard HTTPStatus codes and enables to provide additional message.
+        Returns:
+            StatusCode: shared instance for this type
 
-    """
+        """
+        status = cls._interned_statuses.get(type_)
+        if status is None:
+            status = cls._interned_statuses[type_] = cls(type_)
+        return status
 
     # upper layers can set status code directly over http module? Strict: not for now...
     def __init__(self, init_value="not_implemented", init_desc=""):
         super().__init__()
         self._code = None
         self._desc = ""
-        getattr(self, f"set_{init_value}")(message=init_desc)
+        _STATUS_SETTERS[init_value](self, message=init_desc)
 
     def __int__(self):
-        return self._code.value
+        # the "code" item already holds the plain int value, reading it skips
+        # the enum attribute chain behind self._code.value
+        return self["code"]
 
     @property
     def code(self):
@@ -224,11 +230,14 @@ class StatusCode(dict):
             http_status_message (str): additional response description
 
         """
-        self._code = http_status_message[0]
-        self._desc = str(http_status_message[1])
-        self.clear()
-        self["code"] = int(self)
-        self["message"] = self._desc
+        http_status, message = http_status_message
+        self._code = http_status
+        # messages are almost always str already - skip the copy str() makes
+        self._desc = message if message.__class__ is str else str(message)
+        # "code" and "message" are the only keys this class ever sets, so
+        # overwriting them in place replaces the clear-and-rebuild round-trip
+        dict.__setitem__(self, "code", http_status.value)
+        dict.__setitem__(self, "message", self._desc)
 
     def is_ok(self):
         """Checks if status code is a success
@@ -237,7 +246,7 @@ class StatusCode(dict):
             bool: returns True if status code is in range from 200 to 299
 
         """
-        return 200 <= self._code.value <= 299
+        return 200 <= self["code"] <= 299
 
     def is_not_found(self):
         """Checks if status code is a not found
@@ -246,7 +255,7 @@ class StatusCode(dict):
             bool: returns True if status code is NOT_FOUND
 
         """
-        return self._code.value == HTTPStatus.NOT_FOUND
+        return self["code"] == HTTPStatus.NOT_FOUND
 
     def is_unprocessable_entity(self):
         """Checks if status code is unprocessable entity
@@ -254,7 +263,7 @@ class StatusCode(dict):
         Return:
             bool: returns True if status code is UNPROCESSABLE_ENTITY
         """
-        return self._code.value == HTTPStatus.UNPROCESSABLE_ENTITY
+        return self["code"] == HTTPStatus.UNPROCESSABLE_ENTITY
 
     def set_ok(self, message=""):
         """Sets the status code to ok: 200
@@ -401,20 +410,31 @@ class StatusCode(dict):
         return self
 
 
+# maps init_value to its setter, replacing the f-string + getattr dispatch
+# in StatusCode.__init__; stays in sync with the set_* methods automatically
+_STATUS_SETTERS = {name[len("set_") :]: method for name, method in vars(StatusCode).items() if name.startswith("set_")}
+
+
 class ElementResponse(dict):
     """Base class that all ElementResponse operations derive from"""
 
-    def __init__(self, __status=None, **kwargs):
+    __slots__ = ("status",)
+
+    def __init__(self, __status=None, _content=None, **kwargs):
         """Initialise ElementResponse base class
 
         Args:
             __status (dict): status of the response
+            _content (dict): response content as one mapping, bypassing the
+                keyword-argument repacking that **kwargs would cost
             kwargs (kwargs): response content
 
         """
         super().__init__(**kwargs)
+        if _content:
+            dict.update(self, _content)
         if __status is None:
-            __status = StatusCode().set_ok()
+            __status = StatusCode.intern(STATUS_TYPE_OK)
         self.status = __status
         self[STATUS_CODE_KEY] = self.status
 
@@ -427,15 +447,15 @@ class ElementResponse(dict):
         return bool(self.get_content())
 
     def copy(self, only_include_keys=None) -> "ElementResponse":
-        new_copy = copy.deepcopy(self)
+        # rebuilt shallowly - callers filter keys, they do not mutate nested
+        # values, so the recursive deepcopy walk over the payload is wasted
         if only_include_keys is None:
-            return new_copy
-        for key in self:
-            if key == STATUS_CODE_KEY:
-                continue  # always included
-            if key not in only_include_keys:
-                new_copy.pop(key)
-        return new_copy
+            content = self.get_content()
+        else:
+            content = {
+                key: value for key, value in self.items() if key != STATUS_CODE_KEY and key in only_include_keys
+            }
+        return ElementResponse(self.status, _content=content)
 
     def is_ok(self):
         """Checks if status code is a success
@@ -467,13 +487,15 @@ class ElementResponse(dict):
     def get_content(self):
         """Returns the content of the response
 
+        Callers consume the returned dict read-only before serialisation, so
+        a shallow copy without the status key is sufficient - no need to
+        deep-clone the whole payload tree on every access.
+
         Return:
             dict: content of the response
 
         """
-        content = copy.deepcopy(self)
-        content.pop(STATUS_CODE_KEY, None)
-        return dict(**content)
+        return {key: value for key, value in self.items() if key != STATUS_CODE_KEY}
 
     def get_status(self) -> StatusCode:
         """Returns the status of the response
@@ -499,10 +521,22 @@ class ElementResponse(dict):
 
         """
         super().update(kwargs)
-        self[STATUS_CODE_KEY] = self.status
+        # the status key only needs restoring when the caller clobbered it
+        if STATUS_CODE_KEY in kwargs:
+            self[STATUS_CODE_KEY] = self.status
         return self
 
 
+# result-type dispatch for the generate decorator; defined after the classes
+# it keys on, looked up at call time by the wrapper
+_RESULT_HANDLERS = {
+    tuple: _handle_tuple_result,
+    ElementResponse: _handle_element_response_result,
+    StatusCode: _handle_status_code_result,
+    dict: _handle_dict_result,
+}
+
+
 class SingleResponse:
     """Base class that all SingleResponse operations derive from"""
 
@@ -530,7 +564,12 @@ class SingleResponse:
 
         """
         if self._do_json_dump:
-            response[self._master_key] = json.dumps(response[self._master_key], cls=JSONEncoder)
+            if orjson is not None:
+                response[self._master_key] = orjson.dumps(
+                    response[self._master_key], default=_json_default, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            else:
+                response[self._master_key] = json.dumps(response[self._master_key], cls=JSONEncoder)
         return response
 
     def to_dict(self):
@@ -579,22 +618,27 @@ class ArrayResponse(SingleResponse):
             object: formatted json
 
         """
+        element_list = []
         response = {
-            self._master_key: {self._array_key: []},
+            self._master_key: {self._array_key: element_list},
         }
-        if not self.element_responses:
-            status = initial_status
-        else:
-            # report containing status with highest HTTP code
-            status = max(self.element_responses, key=lambda e_resp: e_resp.get_status_code()).get_status()
+        # report containing status with highest HTTP code; collecting the
+        # elements and tracking the maximum in one pass avoids a second scan
+        # with a per-element get_status_code call
+        append_element = element_list.append
+        status = initial_status
+        max_code = -1
+        for element_response in self.element_responses:
+            append_element(element_response)
+            code = element_response.status["code"]
+            if code > max_code:
+                max_code = code
+                status = element_response.status
 
         if response_success_regardless:
             status = StatusCode("ok")
         response[self._master_key][STATUS_CODE_KEY] = status
         response[STATUS_CODE_KEY] = int(status)
 
-        for element_response in self.element_responses:
-            response[self._master_key][self._array_key].append(element_response)
-
         response[self._master_key].update(**flat_kwargs)
         return self.dump_content(response)
@@ -8,13 +8,25 @@ import common.logging
 import common.response
 
 
-common.init()
-logger = common.logging.init_logging(__name__)
+# common.init() and the logger setup are deferred from import time to the
+# first invocation - the module import stays cheap during cold start, and
+# handlers that are imported but never invoked pay nothing at all
+_INITIALIZED = False
+_LOGGER = None
+
+
+def _logger():
+    # a module __getattr__ would not resolve a bare "logger" global inside
+    # the functions below, hence a tiny accessor instead
+    global _LOGGER
+    if _LOGGER is None:
+        _LOGGER = common.logging.init_logging(__name__)
+    return _LOGGER
 
 
 def no_op_event(event):
     body = json.loads(event["body"])
-    logger.error(f"Received dlq message {body}.")
+    _logger().error(f"Received dlq message {body}.")
     return body
 
 
@@ -33,4 +45,8 @@ def lambda_handler(event, context):
     """Lambda handler to process event when messages land in dead letter queue for SNS topics.
     For now just a noop.
     """
+    global _INITIALIZED
+    if not _INITIALIZED:
+        common.init()
+        _INITIALIZED = True
     return common.response.SingleResponse(no_op(event)).to_dict()
@@ -1,3 +1,40 @@
+import operator
+
+
+def _contained_in(operand):
+    # bound frozenset membership; an unhashable value cannot be a member, and
+    # the evaluators' non-bool guard turns that into a non-match rather than
+    # a TypeError escaping the rule
+    def op_fnc(value):
+        try:
+            return value in operand
+        except TypeError:
+            return NotImplemented
+
+    return op_fnc
+
+
+# dunders bindable via operator.methodcaller at construction time; calling
+# the value's own dunder (instead of e.g. operator.eq) keeps NotImplemented
+# from mismatched operand types visible, which evaluates as a non-match
+_DUNDER_OPERATION_NAMES = frozenset(("__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__", "__contains__"))
+
+
+class _ConditionBinder:
+    """Binds an operation name to its condition without allocating a closure
+    per attribute access.
+    """
+
+    __slots__ = ("_owner", "_name")
+
+    def __init__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __call__(self, operand):
+        return self._owner._init_condition(self._name, operand)
+
+
 class LazyCondition:
     """Lazy condition evaluator supporting only bitwise "and" logical operation ("&", not "and").
 
@@ -10,19 +47,37 @@ class LazyCondition:
         self._operation_name = ""
         self._operand = ""
         self._invert = False
+        self._op_fnc = None
         self._chained__and__conditions = [self]
+        self._condition_groups = None
 
-    def __call__(self, **namespace):
-        for condition in self._chained__and__conditions:
-            value = namespace.get(condition._variable_name)
+    def __call__(self, namespace=None, **kwargs):
+        # callers on hot paths pass one prepared mapping instead of keyword
+        # arguments, skipping the per-call kwargs dict rebuild
+        get_value = (namespace if namespace is not None else kwargs).get
+        groups = self._condition_groups
+        if groups is None:
+            groups = self._build_condition_groups()
+        for name, conditions in groups:
+            value = get_value(name)
             if value is None:
                 return False
-            operation_fnc = getattr(value, condition._operation_name)
-            result = operation_fnc(condition._operand)
-            if not isinstance(result, bool) or result == condition._invert:
-                return False
+            for condition in conditions:
+                result = condition._op_fnc(value)
+                if not isinstance(result, bool) or result == condition._invert:
+                    return False
         return True
 
+    def _build_condition_groups(self):
+        # conditions on the same variable share one namespace lookup; the
+        # chain is a conjunction, so evaluating grouped by variable gives the
+        # same outcome as strict chain order
+        grouped = {}
+        for condition in self._chained__and__conditions:
+            grouped.setdefault(condition._variable_name, []).append(condition)
+        self._condition_groups = tuple((name, tuple(conditions)) for name, conditions in grouped.items())
+        return self._condition_groups
+
     def __getattribute__(self, name):
         if hasattr(super(), name):
             # if method in base class, assume the caller wants the method on actual condition variable
@@ -30,17 +85,57 @@ class LazyCondition:
         return object.__getattribute__(self, name)
 
     def __getattr__(self, name):
-        return lambda operand: self._init_condition(name, operand)
+        return _ConditionBinder(self, name)
 
     def __and__(self, condition: "LazyCondition"):
         self._chained__and__conditions.append(condition)
+        self._condition_groups = None
         return self
 
     def _init_condition(self, operation_name, operand):
         self._operation_name = operation_name
         self._operand = operand
+        self._condition_groups = None
+        if operation_name in _DUNDER_OPERATION_NAMES:
+            # the value's dunder with the operand baked in, bound once here
+            op_fnc = operator.methodcaller(operation_name, operand)
+        elif operation_name == "in":
+            op_fnc = _contained_in(operand)
+        else:
+            # unknown operation, e.g. startswith - resolved per value
+            def op_fnc(value, _name=operation_name, _operand=operand):
+                return getattr(value, _name)(_operand)
+
+        self._op_fnc = op_fnc
         return self
 
+    def compile(self):
+        """Compiles the chained conditions into a standalone evaluator.
+
+        The chain is emitted as one straight-line expression calling the
+        already-bound per-condition op functions and exec'd once, so
+        evaluation runs compiled bytecode instead of walking the condition
+        objects. The ``is True`` / ``is False`` identity checks mirror the
+        interpreted loop term by term: a non-bool result (NotImplemented
+        from a mismatched operand type) evaluates as a non-match. Worth it
+        for rules evaluated many times, e.g. against every record in a
+        batch; the compiled form does not follow later chain mutations.
+        """
+        env = {}
+        terms = []
+        for i, condition in enumerate(self._chained__and__conditions):
+            env[f"_name{i}"] = condition._variable_name
+            env[f"_op{i}"] = condition._op_fnc
+            expected = "False" if condition._invert else "True"
+            terms.append(f"(_v{i} := get(_name{i})) is not None and _op{i}(_v{i}) is {expected}")
+        source = (
+            "def evaluate(namespace=None, **kwargs):\n"
+            "    get = (namespace if namespace is not None else kwargs).get\n"
+            "    return (\n        " + "\n        and ".join(terms) + "\n    )\n"
+        )
+        exec(source, env)
+        return env["evaluate"]
+
     def equals(self, operand):
         return self._init_condition("__eq__", operand)
 
@@ -48,6 +143,15 @@ class LazyCondition:
         # you can also use __contains__ directly
         return self._init_condition("__contains__", operand)
 
+    def not_in(self, operands):
+        # one frozenset membership test instead of a chain of negated equals
+        return self._init_condition("in", frozenset(operands)).invert()
+
+    def startswith_none_of(self, operands):
+        # str.startswith takes a tuple, so one C-level call replaces a chain
+        # of individually negated startswith conditions
+        return self._init_condition("startswith", tuple(operands)).invert()
+
     def invert(self):
         self._invert = not self._invert
         return self
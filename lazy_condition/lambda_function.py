@@ -33,7 +33,7 @@ AWS Resources / Permissions
 
 """
 
-import json
+import types
 import random
 
 import common
@@ -49,6 +49,9 @@ common.init()
 logger = common.logging.init_logging("workflow")
 
 
+# queue wrappers (and the boto3 SQS client underneath) live at module scope
+# deliberately - warm Lambda invocations then reuse the HTTPS connection pool
+# and credential cache instead of re-establishing them per event
 # args = (queue, delay_offset, max_delay, pdf_betavar_alpha, pdf_betavar_beta)
 workflow_article_sap_inject = (aws.SQSQueue(constants.SQS_QUEUE_WORKFLOW_ARTICLE_SAP_INJECT), 0, 0, 1, 1)
 workflow_article_status_100 = (aws.SQSQueue(constants.SQS_QUEUE_WORKFLOW_ARTICLE_STATUS_100), 0, 0, 1, 1)
@@ -72,10 +75,8 @@ DISTRIBUTION_RULES = {
     & Condition("article").contains("articleAttributes"): workflow_article_status_125,
     #
     Condition("topic_name").equals(constants.SNS_TOPIC_NAME_NOTIFICATION_ARTICLE)
-    & Condition("channel").equals("gkkDigitalDataManagement").invert()
-    & Condition("channel").equals("gkkXtraMetaAttributes").invert()
-    & Condition("channel").startswith("gkkCilGkkSap").invert()
-    & Condition("channel").startswith("_").invert(): workflow_article_status_125,
+    & Condition("channel").not_in(("gkkDigitalDataManagement", "gkkXtraMetaAttributes"))
+    & Condition("channel").startswith_none_of(("gkkCilGkkSap", "_")): workflow_article_status_125,
     #
     Condition("topic_name").equals(constants.SNS_TOPIC_NAME_NOTIFICATION_ARTICLE)
     & Condition("status").contains("125")
@@ -107,64 +108,166 @@ DISTRIBUTION_RULES = {
 }
 
 
+def _topic_name_literal(rule):
+    """Extracts the literal from the rule's topic_name equality guard, or
+    None when the rule carries no such guard.
+    """
+    for condition in rule._chained__and__conditions:
+        if (
+            condition._variable_name == "topic_name"
+            and condition._operation_name == "__eq__"
+            and not condition._invert
+        ):
+            return condition._operand
+    return None
+
+
+# every rule starts with a topic_name equality guard, so rules are bucketed by
+# that literal once at import time - per notification only the handful of
+# rules for its topic get evaluated instead of the whole table; rules without
+# the guard land in a fallback bucket appended to every topic
+_RULES_BY_TOPIC = {}
+for _rule, _workflow_entity_args in DISTRIBUTION_RULES.items():
+    _RULES_BY_TOPIC.setdefault(_topic_name_literal(_rule), []).append((_rule, _workflow_entity_args))
+_FALLBACK_RULES = _RULES_BY_TOPIC.pop(None, [])
+for _bucket in _RULES_BY_TOPIC.values():
+    _bucket.extend(_FALLBACK_RULES)
+# the rule table never changes after import, so each bucket entry evaluates a
+# compiled flat predicate instead of walking the condition objects per call
+_RULES_BY_TOPIC = {
+    topic: [(rule.compile(), args) for rule, args in bucket] for topic, bucket in _RULES_BY_TOPIC.items()
+}
+_FALLBACK_RULES = [(rule.compile(), args) for rule, args in _FALLBACK_RULES]
+
+
+SQS_BATCH_MAX_ENTRIES = 10
+
+# bound once - these are hit on every notification, and a plain module
+# global is one dict lookup instead of a module attribute chain
+_betavariate = random.betavariate
+_STATUS_LOOKUP = constants.STATUS_LOOKUP
+
+# shared read-only default - .get(..., {}) would allocate a fresh dict on
+# every message without an article or lifecycle
+_EMPTY_DICT = types.MappingProxyType({})
+
+# json.loads/dumps with cls= instantiate a fresh codec per call; the shared
+# instances are stateless and safe to reuse across invocations
+_JSON_DECODER = helpers.JSONDecoder()
+_JSON_ENCODER = helpers.JSONEncoder()
+
+
 class MessageSender:
     """Purpose of context manager is to skip sending duplicated messages to the same queue"""
 
     def __init__(self, message, message_attributes):
         self.message = message
         self.message_attributes = MessageAttributes.from_attributes(message_attributes)
-        self._collected_targets = []
-        self._buffering_messages = False
+        # insertion-ordered dict gives O(1) duplicate checks; keyed on id() of
+        # the queue since the queue wrapper is not guaranteed to be hashable
+        self._collected_targets = {}
+        self._body = None
+        # swapping the bound method on context enter/exit replaces the
+        # per-call buffering flag branch
+        self.send = self._send_immediate
+
+    def _message_body(self):
+        # the message never changes within one sender, encode it exactly once
+        if self._body is None:
+            self._body = _JSON_ENCODER.encode(self.message)
+        return self._body
 
     def __enter__(self):
-        self._buffering_messages = True
+        self.send = self._send_buffered
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._buffering_messages = False
-        logger.info(f"Sending on context exit")
-        for entity_args in self._collected_targets:
-            self.send(*entity_args)
-
-    def send(self, queue, delay_offset, max_delay, alpha, beta):
-        if self._buffering_messages:
-            entity_args = (queue, delay_offset, max_delay, alpha, beta)
-            logger.info(f"Preparing to send: {entity_args}")
-            # skip duplicated messages
-            if entity_args not in self._collected_targets:
-                self._collected_targets.append(entity_args)
-        else:
-            delay_seconds = delay_offset + round(max_delay * random.betavariate(alpha, beta))
-            logger.info(f"Sending: {queue, delay_offset, max_delay, alpha, beta}")
-            logger.info(f"Sending message: {self.message}")
-            logger.info(f"Sending message_attributes: {self.message_attributes}")
-            return queue.send_message(
-                MessageBody=json.dumps(self.message, cls=helpers.JSONEncoder),
-                MessageAttributes=self.message_attributes,
-                DelaySeconds=delay_seconds,
-            )
+        self.send = self._send_immediate
+        logger.info("Sending on context exit")
+        if not self._collected_targets:
+            return
+        # one batched request per queue instead of one round-trip per target
+        body = self._message_body()
+        targets_by_queue = {}
+        for queue, delay_offset, max_delay, alpha, beta in self._collected_targets.values():
+            _, delay_args = targets_by_queue.setdefault(id(queue), (queue, []))
+            delay_args.append((delay_offset, max_delay, alpha, beta))
+        for queue, delay_args in targets_by_queue.values():
+            entries = [
+                {
+                    "Id": str(entry_id),
+                    "MessageBody": body,
+                    "MessageAttributes": self.message_attributes,
+                    "DelaySeconds": delay_offset + round(max_delay * _betavariate(alpha, beta)),
+                }
+                for entry_id, (delay_offset, max_delay, alpha, beta) in enumerate(delay_args)
+            ]
+            for start in range(0, len(entries), SQS_BATCH_MAX_ENTRIES):
+                response = queue.send_message_batch(Entries=entries[start : start + SQS_BATCH_MAX_ENTRIES])
+                failed = response.get("Failed")
+                if failed:
+                    logger.error("Sending batch to %s failed for entries: %s", queue, failed)
+                    raise exception.RetryRuntimeError(f"Failed to send {len(failed)} messages to {queue}")
+
+    def _send_buffered(self, queue, delay_offset, max_delay, alpha, beta):
+        entity_args = (queue, delay_offset, max_delay, alpha, beta)
+        # %-style defers stringification until the level is enabled
+        logger.info("Preparing to send: %s", entity_args)
+        # skip duplicated messages
+        self._collected_targets.setdefault((id(queue), delay_offset, max_delay, alpha, beta), entity_args)
+
+    def _send_immediate(self, queue, delay_offset, max_delay, alpha, beta):
+        delay_seconds = delay_offset + round(max_delay * _betavariate(alpha, beta))
+        logger.info("Sending: %s", (queue, delay_offset, max_delay, alpha, beta))
+        logger.info("Sending message: %s", self.message)
+        logger.info("Sending message_attributes: %s", self.message_attributes)
+        return queue.send_message(
+            MessageBody=self._message_body(),
+            MessageAttributes=self.message_attributes,
+            DelaySeconds=delay_seconds,
+        )
 
 
 def distribute_notification_to_queue(notification):
     topic_name = notification["TopicArn"].split(":")[-1]
-    message = json.loads(notification["Message"], cls=helpers.JSONDecoder)
+    message = _JSON_DECODER.decode(notification["Message"])
     message_attributes = notification["MessageAttributes"]
-    channel = message.get("channel")
-    media_type = message.get("mediaType", "")
-    status = constants.STATUS_LOOKUP[message.get("status")]
-    article = message.get("article", {})
-    lifecycle = article.get("lifecycle", {})
-    local_variables = locals()
+    get = message.get
+    channel = get("channel")
+    media_type = get("mediaType", "")
+    status = _STATUS_LOOKUP[get("status")]
+    article = get("article") or _EMPTY_DICT
+    lifecycle = article.get("lifecycle") or _EMPTY_DICT
+    # conditions only reference these fields - an explicit mapping replaces
+    # the locals() snapshot and the per-rule unpacking of unrelated locals
+    ctx = {
+        "topic_name": topic_name,
+        "channel": channel,
+        "media_type": media_type,
+        "status": status,
+        "article": article,
+        "lifecycle": lifecycle,
+    }
 
     with MessageSender(message, message_attributes) as message_sender:
-        for rule, workflow_entity_args in DISTRIBUTION_RULES.items():
-            if rule(**local_variables):
+        # several rules route to the same target; once a target matched, the
+        # remaining rules for it would only be deduplicated away by the
+        # sender, so their evaluation is skipped outright
+        matched_targets = set()
+        for rule, workflow_entity_args in _RULES_BY_TOPIC.get(topic_name, _FALLBACK_RULES):
+            target_id = id(workflow_entity_args)
+            if target_id in matched_targets:
+                continue
+            if rule(ctx):
+                matched_targets.add(target_id)
                 message_sender.send(*workflow_entity_args)
 
 
 @exception.lambda_exception_handler(logger, reraise_as=exception.RetryRuntimeError)
 def lambda_handler(event, context):
+    # local binding - LOAD_FAST per record instead of LOAD_GLOBAL
+    _distribute = distribute_notification_to_queue
     for record in event.get("Records", []):
         item = record.get("Sns", {})
         if item.get("Type") == "Notification":
-            distribute_notification_to_queue(item)
+            _distribute(item)
@@ -16,23 +16,32 @@ import urllib.parse
 from . import constants
 from . import exception
 
-SENTRY_SDK_AVAILABLE = False
-if "DISABLE_SENTRY" in os.environ.keys() and os.environ["DISABLE_SENTRY"] == "True":
-    pass
-else:
-    try:
-        import sentry_sdk
-        import sentry_sdk.utils
-        from sentry_sdk import Hub
-        from sentry_sdk.integrations.aws_lambda import AwsLambdaIntegration
-        from sentry_sdk.integrations.logging import LoggingIntegration
-
-        SENTRY_SDK_AVAILABLE = True
-    except:
-        pass
+# resolved on first use: the module once available, False when disabled or
+# not installed; importing sentry_sdk and its integrations is heavy enough to
+# show up in the Lambda INIT phase, so handlers never touching sentry skip it
+_SENTRY_SDK = None
+
+
+def _sentry_sdk():
+    global _SENTRY_SDK
+    if _SENTRY_SDK is None:
+        if os.environ.get("DISABLE_SENTRY") == "True":
+            _SENTRY_SDK = False
+        else:
+            try:
+                import sentry_sdk
+                import sentry_sdk.utils
+                import sentry_sdk.integrations.aws_lambda
+                import sentry_sdk.integrations.logging
+
+                _SENTRY_SDK = sentry_sdk
+            except:
+                _SENTRY_SDK = False
+    return _SENTRY_SDK
 
 
 getLogger = logging.getLogger
+DEBUG = logging.DEBUG
 SDK_DNS = "https://46ef576c32334494862c3be36ac0916e@o1076105.ingest.sentry.io/6077407"
 DEFAULT_FORMATTER = logging.Formatter(
     fmt="%(asctime)s [%(threadName)-10s] %(levelname)-5s (%(module)s~%(funcName)s:%(lineno)d) %(message)s"
@@ -55,19 +64,23 @@ def init_logging(logging_for_name):
     handler.setFormatter(DEFAULT_FORMATTER)
     logger.addHandler(handler)
     logger._handler_added = True
-    logger.info(f'Logger instance for "{logging_for_name}" created, running on {sys.version}')
+    logger.info('Logger instance for "%s" created, running on %s', logging_for_name, sys.version)
     return logger
 
 
 def init_sentry():
-    if SENTRY_SDK_AVAILABLE:
-        sentry_logging = LoggingIntegration(
+    sentry_sdk = _sentry_sdk()
+    if sentry_sdk:
+        sentry_logging = sentry_sdk.integrations.logging.LoggingIntegration(
             level=logging.INFO,  # Capture info and above as breadcrumbs
             event_level=logging.ERROR,  # Send errors as events
         )
         sentry_sdk.init(
             dsn=SDK_DNS,
-            integrations=[sentry_logging, AwsLambdaIntegration(timeout_warning=True)],
+            integrations=[
+                sentry_logging,
+                sentry_sdk.integrations.aws_lambda.AwsLambdaIntegration(timeout_warning=True),
+            ],
             environment=urllib.parse.urlsplit(constants.API_URL_CORE).netloc,
             before_send=before_sentry_send,
         )
@@ -94,14 +107,13 @@ class SentryLogger(logging.Logger):
     leading to sentry tag: stop=True and build_version="1.2.1" and context attribute={1: 2, 3: 4}
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if not SENTRY_SDK_AVAILABLE:
-            self.clear_sentry_scope = lambda *args, **kwargs: None
-            self.set_tag = lambda *args, **kwargs: None
-            self.set_context = lambda *args, **kwargs: None
-
     def _optional_entries(self, clear_scope=False, **kwargs):
+        # runs on every single log call; in the overwhelmingly common case of
+        # no sentry kwargs, return the mapping untouched instead of copying
+        if not kwargs or not any(isinstance(key, str) and key.startswith(("tag_", "context_")) for key in kwargs):
+            if clear_scope:
+                self.clear_sentry_scope()
+            return kwargs
         cleaned_kwargs = kwargs.copy()
         tags = []
         contexts = []
@@ -120,19 +132,28 @@ class SentryLogger(logging.Logger):
         contexts and [self.set_context(entry[0], entry[1]) for entry in contexts]
         return cleaned_kwargs
 
+    # the lazy module check makes these no-ops when sentry is disabled or not
+    # installed, without per-logger lambda patching in __init__
+
     @staticmethod
     def clear_sentry_scope():
-        Hub.current.scope.clear()
+        sentry_sdk = _sentry_sdk()
+        if sentry_sdk:
+            sentry_sdk.Hub.current.scope.clear()
 
     @staticmethod
     def set_tag(name, value):
-        Hub.current.scope.set_tag(name, value)
+        sentry_sdk = _sentry_sdk()
+        if sentry_sdk:
+            sentry_sdk.Hub.current.scope.set_tag(name, value)
 
     @staticmethod
     def set_context(name, value):
-        if not isinstance(value, dict):
-            value = {name: value}
-        Hub.current.scope.set_context(name, value)
+        sentry_sdk = _sentry_sdk()
+        if sentry_sdk:
+            if not isinstance(value, dict):
+                value = {name: value}
+            sentry_sdk.Hub.current.scope.set_context(name, value)
 
     def exception(self, msg, *args, **kwargs):
         super().exception(msg, *args, **self._optional_entries(**kwargs))
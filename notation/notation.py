@@ -1,4 +1,5 @@
 import logging
+import functools
 from enum import Enum, auto
 
 
@@ -16,10 +17,18 @@ def get_possible_index(str_):
         return str_
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_key(dotted_key):
+    """Same dotted keys are looked up over and over in pipeline code, so the
+    split and per-token index detection run once per distinct key.
+    """
+    return tuple((key, get_possible_index(key)) for key in dotted_key.split("."))
+
+
 def extract_data(lookup_reference, from_dotted_key):
     index_or_key = get_possible_index(from_dotted_key)
     if index_or_key is None:
-        return FailedExtract()
+        return _FAILED
     elif isinstance(index_or_key, int):
         type_ = list
     else:
@@ -31,7 +40,7 @@ def extract_data(lookup_reference, from_dotted_key):
         # KeyError if dict key invalid
         # TypeError if ref is already a value
         # AttributeError if it is value and int
-        return FailedExtract()
+        return _FAILED
     return ref
 
 
@@ -41,15 +50,29 @@ class DottedState(Enum):
 
 
 class FailedExtract(object):
+    # kept for external importers; internally the singleton below is handed
+    # out and checked by identity, avoiding an allocation per failed lookup
     pass
 
 
+_FAILED = FailedExtract()
+
+
 class DottedNotationMixin:
     def __getitem__(self, key, default=None):
         if "." in key:
-            for ref_status, ref_or_value, last_ref, remaining_key in self.iter_getter(self, key):
-                if ref_status == DottedState.LAST_REFERENCE:
-                    return ref_or_value
+            # tight loop over the pre-parsed tokens; the generator machinery
+            # in iter_getter only pays off for the setter, which needs the
+            # intermediate references
+            ref = self
+            for _, maybe_index in _parse_key(key):
+                if maybe_index is None:
+                    return default
+                try:
+                    ref = ref[maybe_index]
+                except (IndexError, KeyError, TypeError, AttributeError):
+                    return default
+            return ref
         try:
             return super().__getitem__(key)
         except KeyError:
@@ -66,14 +89,13 @@ class DottedNotationMixin:
         return self.__getitem__(key, default)
 
     def iter_setter(self, ref_or_value, last_ref, remaining_key, value):
-        keys = remaining_key.split(".")
-        key_types = [(key, get_possible_index(key)) for key in keys]
+        key_types = _parse_key(remaining_key)
         ref = last_ref
-        for traversal_id in range(len(keys)):
+        for traversal_id in range(len(key_types)):
             key, maybe_index = key_types[traversal_id]
             if maybe_index is None:
                 return
-            is_last_key = traversal_id + 1 == len(keys)
+            is_last_key = traversal_id + 1 == len(key_types)
             if isinstance(maybe_index, str) and isinstance(ref, dict):
                 if is_last_key:
                     ref[key] = value
@@ -112,14 +134,14 @@ class DottedNotationMixin:
             keys = dotted_keys.split(".", 1)
             extracted_reference = extract_data(lookup_reference, keys[0])
             if len(keys) == 1:
-                if isinstance(extracted_reference, FailedExtract):
+                if extracted_reference is _FAILED:
                     yield DottedState.LAST_REFERENCE, None, last_reference, remaining_keys
                     return
                 else:
                     yield DottedState.LAST_REFERENCE, extracted_reference, last_reference, remaining_keys
                     return
             else:
-                if isinstance(extracted_reference, FailedExtract):
+                if extracted_reference is _FAILED:
                     yield DottedState.LAST_REFERENCE, None, last_reference, remaining_keys
                     return
                 else:
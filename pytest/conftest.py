@@ -2,12 +2,15 @@ import os
 import sys
 import pytest
 import logging
+import functools
 import importlib
 import importlib.util
+from unittest import mock
 
 os.environ["DISABLE_SENTRY"] = "True"
 
-pytest_plugins = [
+# tuple - pytest hashes and iterates this on every collection pass
+pytest_plugins = (
     "tests.sample.data.fnctest.adapter.best",
     "tests.sample.data.fnctest.article.article",
     "tests.sample.data.fnctest.article.article_anchor",
@@ -69,7 +72,7 @@ pytest_plugins = [
     "tests.sample.data.fnctest.workbench.model.wb_ff_model",
     "tests.sample.data.fnctest.authentication.auth",
     "tests.sample.data.fnctest.authentication.cognito",
-]
+)
 
 logger = logging.getLogger("test")
 
@@ -84,21 +87,32 @@ os.environ["TEST_TYPE_PIPE"] = os.environ.get("CI", "false")
 LOADED_LAMBDAS = {}
 
 
+def _load_lambda_module_cached(base_dir, parent_dir="", module_name="lambda_function", reload=False):
+    abs_path = os.path.abspath(os.path.join(base_dir, parent_dir, module_name + ".py"))
+    if reload is True:
+        LOADED_LAMBDAS.pop(abs_path, None)
+    module_ref = LOADED_LAMBDAS.get(abs_path)
+    if module_ref is None:
+        spec = importlib.util.spec_from_file_location(module_name, abs_path)
+        module_ref = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module_ref)
+        logger.info(f"imported module from {abs_path}")
+        LOADED_LAMBDAS[abs_path] = module_ref
+    return module_ref
+
+
 @pytest.fixture(scope="class")
 def load_lambda_module(request):
+    # the module cache above is session-wide, so every re-request of an
+    # already-imported lambda package is a dict hit; the fixture itself only
+    # binds the requesting test file's directory
     logger.info(request.module)
+    return functools.partial(_load_lambda_module_cached, request.fspath.dirname)
 
-    def _load_lambda_module(parent_dir="", module_name="lambda_function", reload=False):
-        abs_path = os.path.abspath(os.path.join(request.fspath.dirname, parent_dir, module_name + ".py"))
-        if abs_path not in LOADED_LAMBDAS or reload is True:
-            spec = importlib.util.spec_from_file_location(module_name, abs_path)
-            module_ref = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module_ref)
-            logger.info(f"imported module from {abs_path}")
-            LOADED_LAMBDAS[abs_path] = module_ref
-        return LOADED_LAMBDAS[abs_path]
 
-    yield _load_lambda_module
+@pytest.fixture
+def sqs_mock():
+    return mock.MagicMock()
 
 
 @pytest.fixture(scope="class")
@@ -5,15 +5,30 @@ from http import HTTPStatus
 
 from articlelake import articlelake
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        # handlers expect str bodies, orjson returns bytes
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 logger = logging.getLogger("test")
 
 
 class TestAdapterBest:
-    @pytest.fixture(autouse=True)
-    def setup(self, load_lambda_module):
-        self.module_get = load_lambda_module(parent_dir="_get")
-        self.module_post = load_lambda_module(parent_dir="_post")
-        self.module_patch = load_lambda_module(parent_dir="_patch")
+    @pytest.fixture(autouse=True, scope="class")
+    def setup(self, request, load_lambda_module):
+        # class scope - the three lambda packages load once per class (and
+        # once per xdist worker), not once per test
+        request.cls.module_get = load_lambda_module(parent_dir="_get")
+        request.cls.module_post = load_lambda_module(parent_dir="_post")
+        request.cls.module_patch = load_lambda_module(parent_dir="_patch")
 
     def get_article(self, gtin, channel):
         event = {"headers": {"gtin": gtin, "channel": channel}}
@@ -21,7 +36,7 @@ class TestAdapterBest:
         return get_response
 
     def post_or_patch_article(self, data, context=None, method="POST"):
-        event = {"body": json.dumps(data)}
+        event = {"body": _dumps(data)}
         if method == "POST":
             response = self.module_post.lambda_handler(event, context)
         else:
@@ -32,7 +47,7 @@ class TestAdapterBest:
         response = self.post_or_patch_article(data_article_post_best_payload)
 
         assert HTTPStatus.OK == response["statusCode"]
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         first_returned_article = body["articles"][0]
         assert HTTPStatus.CREATED == first_returned_article["statusCode"]["code"]
         assert "articles" in body
@@ -49,26 +64,27 @@ class TestAdapterBest:
     )
     def test_get(self, gtin, channel, should_have_hashed_references):
         response = self.get_article(gtin=gtin, channel=channel)
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert HTTPStatus.OK == response["statusCode"]
         assert "articles" in body
         assert len(body["articles"]) == 1
-        article = json.loads(response["body"])["articles"][0]
-        hashed_anchor_gtin = None
-        hashed_gtin = None
-        try:
-            hashed_anchor_gtin = article["references"]["supplyChain"][0]["aux"]["hashedAnchorGTIN"]
-            hashed_gtin = article["references"]["supplyChain"][0]["aux"]["hashedGTIN"]
-        except KeyError as e:
-            pass
+        article = body["articles"][0]
+        supply_chain = article.get("references", {}).get("supplyChain", [])
+        aux = supply_chain[0].get("aux", {}) if supply_chain else {}
+        hashed_anchor_gtin = aux.get("hashedAnchorGTIN")
+        hashed_gtin = aux.get("hashedGTIN")
         assert should_have_hashed_references == bool(hashed_anchor_gtin and hashed_gtin)
 
     def test_get_pid(self, data_article_get_vid_pid):
         article_response = self.get_article(
             gtin=data_article_get_vid_pid["gtin"], channel=data_article_get_vid_pid["channel"]
         )
-        body = json.loads(article_response["body"])
-        article = articlelake.Article(**body["articles"][0])
+        body = _loads(article_response["body"])
+        article_data = body["articles"][0]
+        # pydantic v2 model_validate skips the kwargs unpacking round trip;
+        # fall back to the plain constructor for non-pydantic Article builds
+        validate = getattr(articlelake.Article, "model_validate", None)
+        article = validate(article_data) if validate else articlelake.Article(**article_data)
         assert article.get_pid() == "GJGNMK46"
         assert article.get_vid() == "GJGNMK4603"
 
@@ -82,8 +98,10 @@ class TestAdapterBest:
         table = articlelake.model.ArticleModel()
         table.select_table(self.module_post.common.constants.DYNAMO_DB_TABLE_NAME_ARTICLELAKE)
 
-        for article in articles:
-            table._delete(article["gtin"], article["channel"])
+        # one BatchWriteItem instead of a DeleteItem round trip per article
+        with table.table.batch_writer() as batch_writer:
+            for article in articles:
+                batch_writer.delete_item(Key={"gtin": article["gtin"], "channel": article["channel"]})
 
         articlelake.model.article.SharedTable().clear()
         articlelake.model.channel.SharedTable().clear()
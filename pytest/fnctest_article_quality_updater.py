@@ -8,6 +8,19 @@ import common
 import articlelake as articlelake
 from common.dynamodb import DynamoDBDeserializer
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        # handlers expect str bodies, orjson returns bytes
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 
 @mock.patch("common.constants.SQS_QUEUE_ARTICLE_QUALITY_UPDATER", "queue-article-quality-update")
 class TestArticleQualityUpdater:
@@ -43,7 +56,7 @@ class TestArticleQualityUpdater:
 
     def post_or_patch_article(self, data, context=None, method="POST", headers=None):
         event = {
-            "body": json.dumps(data),
+            "body": _dumps(data),
         }
         if headers:
             event.update(headers=headers["headers"])
@@ -53,10 +66,14 @@ class TestArticleQualityUpdater:
         return self.module_article_patch.lambda_handler(event, context)
 
     def test_article_quality_updater_sends_sqs_messages(
-        self, load_lambda_module, data_article_quality_updater_dynamodb_record, data_articles_quality_updater_payload
+        self,
+        load_lambda_module,
+        sqs_mock,
+        data_article_quality_updater_dynamodb_record,
+        data_articles_quality_updater_payload,
     ):
         self.article_quality_updater = load_lambda_module()
-        self.article_quality_updater.sqs = mock.MagicMock()
+        self.article_quality_updater.sqs = sqs_mock
         self.post_or_patch_article(data_articles_quality_updater_payload)
 
         self.article_quality_updater.lambda_handler(data_article_quality_updater_dynamodb_record, None)
@@ -74,7 +91,7 @@ class TestArticleQualityUpdater:
             queue = sqs_resource.create_queue(QueueName=common.constants.SQS_QUEUE_ARTICLE_QUALITY_UPDATER)
             self.article_quality_updater = load_lambda_module()
             self.article_quality_updater.sqs._queue = queue
-            payload = {"body": json.dumps(data_articles_quality_updater_payload)}
+            payload = {"body": _dumps(data_articles_quality_updater_payload)}
             self.module_article_post.lambda_handler(payload, None)
 
             response = self.get_article(
@@ -82,7 +99,7 @@ class TestArticleQualityUpdater:
                 channel=data_articles_quality_updater_payload["articles"][0]["channel"],
             )
 
-            article0 = json.loads(response["body"])["articles"][0]
+            article0 = _loads(response["body"])["articles"][0]
             assert article0["quality"]["qualityTrafficLight"] == "green"
 
             self.article_quality_updater.lambda_handler(data_article_quality_updater_dynamodb_record, None)
@@ -94,7 +111,7 @@ class TestArticleQualityUpdater:
                 channel=data_articles_quality_updater_payload["articles"][0]["channel"],
             )
 
-            article0 = json.loads(response["body"])["articles"][0]
+            article0 = _loads(response["body"])["articles"][0]
             assert article0["quality"]["qualityTrafficLight"] == "amber"
 
     @staticmethod
@@ -107,13 +124,14 @@ class TestArticleQualityUpdater:
     def test_article_quality_updater_force_update_article_quality_when_classification_is_removed(
         self,
         load_lambda_module,
+        sqs_mock,
         data_article_quality_updater_dynamodb_record_classification_remove,
         data_articles_quality_updater_payload,
     ):
         self.article_quality_updater = load_lambda_module()
-        self.article_quality_updater.sqs = mock.MagicMock()
+        self.article_quality_updater.sqs = sqs_mock
 
-        payload = {"body": json.dumps(data_articles_quality_updater_payload)}
+        payload = {"body": _dumps(data_articles_quality_updater_payload)}
         self.module_article_post.lambda_handler(payload, None)
 
         self.article_quality_updater.lambda_handler(
@@ -132,7 +150,7 @@ class TestArticleQualityUpdater:
 
         payload = {
             "Records": [
-                json.dumps(
+                _dumps(
                     {
                         "articles": data_articles_quality_updater_payload["articles"],
                         "classification_options": classification_options,
@@ -147,7 +165,7 @@ class TestArticleQualityUpdater:
         for article in data_articles_quality_updater_payload["articles"]:
             response = self.get_article(gtin=article["gtin"], channel=article["channel"])
 
-            body = json.loads(response["body"])
+            body = _loads(response["body"])
 
             assert "quality" in body["articles"][0]
             assert isinstance(body["articles"][0]["quality"], dict)
@@ -155,8 +173,10 @@ class TestArticleQualityUpdater:
     def test_cleanup(self, data_articles_quality_updater_payload):
         table = articlelake.ArticleOperation()
 
-        for article in data_articles_quality_updater_payload["articles"]:
-            table._delete(article["gtin"], article["channel"])
+        # one BatchWriteItem instead of a DeleteItem round trip per article
+        with table.table.batch_writer() as batch_writer:
+            for article in data_articles_quality_updater_payload["articles"]:
+                batch_writer.delete_item(Key={"gtin": article["gtin"], "channel": article["channel"]})
 
         table = articlelake.Classification(force_reload=True)
         for article_type in self.classification_test_items:
@@ -1,10 +1,12 @@
 """This module contains the operation handlers for Amazon S3 access through Boto3
 
 """
-import copy
+import io
 import datetime
+from xml.sax.saxutils import escape as _xml_escape
 
 import botocore.exceptions
+from boto3.s3.transfer import TransferConfig
 
 from .aws import default_client, AWS
 from . import constants
@@ -16,6 +18,17 @@ from . import helpers
 
 logger = logging.getLogger(__name__)
 
+# env-var style constants arrive as strings; parse them once at import
+# instead of per request
+_URL_TTL_SECONDS = int(constants.URL_TTL_IN_DAYS) * 86400
+_URL_TTL_TIMEDELTA = datetime.timedelta(int(constants.URL_TTL_IN_DAYS))
+_PAGINATION_MAX_KEYS = int(constants.PAGINATION_MAX_KEYS)
+
+# payloads above the threshold upload as parallel multipart parts
+_MULTIPART_THRESHOLD = 8 << 20
+_UPLOAD_CONFIG = TransferConfig(multipart_threshold=_MULTIPART_THRESHOLD, max_concurrency=10, use_threads=True)
+_DOWNLOAD_CONFIG = TransferConfig(multipart_threshold=_MULTIPART_THRESHOLD, max_concurrency=16, use_threads=True)
+
 
 class AccessPoint:
     """Wrapper for S3 client."""
@@ -34,7 +47,7 @@ class AccessPoint:
         )
         self.signing_client = pre_signing_aws_client.get_client_s3()
 
-    @response.generate
+    @response.generate_fast
     def delete_object(self, bucket_name, key):
         """Delete an object from S3 bucket
 
@@ -56,6 +69,40 @@ class AccessPoint:
             return response.StatusCode().set_bad_request(msg)
 
     @response.generate
+    def delete_objects(self, bucket_name, keys):
+        """Delete multiple objects from S3 bucket
+
+        S3 DeleteObjects accepts up to 1000 keys per call, so the keys are
+        chunked accordingly - one round trip per 1000 keys instead of one
+        per key.
+
+        Args:
+            bucket_name (str): name of the bucket where the objects reside
+            keys (list): keys of the objects to be deleted
+
+        Returns:
+            dict: Transaction result with any per-key errors reported by S3
+        """
+        keys = list(keys)
+        logger.info(f"Deleting {len(keys)} objects from bucket: {bucket_name}")
+        errors = []
+        try:
+            for start in range(0, len(keys), 1000):
+                result = self.client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in keys[start : start + 1000]],
+                        "Quiet": True,
+                    },
+                )
+                errors.extend(result.get("Errors", ()))
+        except botocore.exceptions.ClientError as exc:
+            msg = f"Can not delete objects: {exc}"
+            logger.exception(msg)
+            return response.StatusCode().set_bad_request(msg)
+        return dict(errors=errors)
+
+    @response.generate_fast
     def get_object(self, bucket_name, key):
         """Retrieve an object from S3 bucket
 
@@ -90,6 +137,8 @@ class AccessPoint:
 
         """
         try:
+            # callers can still pass their own Config
+            kwargs.setdefault("Config", _DOWNLOAD_CONFIG)
             self.client.download_fileobj(bucket_name, key, binary_fo, **kwargs)
             return response.StatusCode().set_ok()
         except botocore.exceptions.ClientError as exc:
@@ -121,10 +170,10 @@ class AccessPoint:
         url = self.signing_client.generate_presigned_url(
             "get_object",
             Params={"Bucket": bucket_name, "Key": key},
-            ExpiresIn=int(constants.URL_TTL_IN_DAYS) * 24 * 3600,
+            ExpiresIn=_URL_TTL_SECONDS,
         )
         valid_from = helpers.get_localized_datetime_now()
-        valid_until = valid_from + datetime.timedelta(int(constants.URL_TTL_IN_DAYS))
+        valid_until = valid_from + _URL_TTL_TIMEDELTA
         result = dict(
             sourceUrl=url,
             sourceUrlValidUntil=valid_until.isoformat(timespec="milliseconds"),
@@ -148,11 +197,31 @@ class AccessPoint:
         return_dict = self.client.list_objects_v2(
             Bucket=bucket_name,
             Prefix=prefix,
-            MaxKeys=int(constants.PAGINATION_MAX_KEYS),
+            MaxKeys=_PAGINATION_MAX_KEYS,
             **kwargs,
         )
         return dict(listed_objects=return_dict)
 
+    def iter_objects(self, bucket_name, prefix="", **kwargs):
+        """Lazily iterate all objects under a prefix across result pages
+
+        Unlike :meth:`list_objects`, this follows continuation tokens via the
+        list_objects_v2 paginator, so callers can walk arbitrarily large
+        listings without holding more than one page in memory (or slice the
+        iterator to stop early).
+
+        Args:
+            bucket_name (str): name of the bucket where the objects reside
+            prefix (str): prefix of the objects to be accessed
+            kwargs (kwargs): additional paginate parameters
+
+        Yields:
+            dict: one object description per listed object
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, **kwargs):
+            yield from page.get("Contents", ())
+
     @response.generate
     def store_object(self, bucket_name, key, payload, content_type="", tags=None):
         """Retrieve list of objects based on prefix
@@ -171,10 +240,21 @@ class AccessPoint:
             tags = {}
         logger.info(f"Storing to bucket: {bucket_name} with key: {key}; payload len={len(payload)}")
         try:
-            self.resource.Object(bucket_name, key).put(Body=payload, ContentType=content_type)
+            extra_args = {"ContentType": content_type}
             if tags:
-                s3_properties.MediaTagging(bucket_name, key).put(**tags)
-                tags_response = dict(**s3_properties.MediaTagging(bucket_name, key).get())
+                # PutObject accepts the tags inline as a URL-encoded string,
+                # fusing put + put_object_tagging into one round trip; the two
+                # calls cannot be issued in parallel instead, since tagging
+                # requires the object to already exist
+                tagging = s3_properties.MediaTagging(bucket_name, key)
+                tag_list = tagging.create_s3_tags(**tags)
+                extra_args["Tagging"] = s3_properties.tags_to_querystring(tag_list)
+                tags_response = tagging._tags_from_tag_set(tag_list, separate_aggregated=True)
+            if len(payload) > _MULTIPART_THRESHOLD:
+                binary_fo = io.BytesIO(payload if isinstance(payload, bytes) else payload.encode())
+                self.client.upload_fileobj(binary_fo, bucket_name, key, ExtraArgs=extra_args, Config=_UPLOAD_CONFIG)
+            else:
+                self.resource.Object(bucket_name, key).put(Body=payload, **extra_args)
         except botocore.exceptions.ClientError as exc:
             logger.exception(exc)
             return response.StatusCode().set_bad_request(message=exc)
@@ -203,7 +283,7 @@ class AccessPoint:
             return response.StatusCode().set_bad_request(message=exc)
         return dict(**s3_properties.MediaTagging(bucket_name, key).get())
 
-    @response.generate
+    @response.generate_fast
     def get_object_tags(self, bucket_name: str, key_name: str):
         """Retrieves tags of an S3 object.
 
@@ -234,17 +314,22 @@ class AccessPoint:
         """
 
         try:
-            xml_tags = [f'<Tag><Key>{item["Key"]}</Key><Value>{item["Value"]}</Value></Tag>' for item in tags]
+            tagset = "".join(
+                f'<Tag><Key>{_xml_escape(item["Key"])}</Key><Value>{_xml_escape(item["Value"])}</Value></Tag>'
+                for item in tags
+            )
             fields = {
-                "tagging": f"<Tagging><TagSet>{ ''.join(xml_tags) }</TagSet></Tagging>",
+                "tagging": f"<Tagging><TagSet>{tagset}</TagSet></Tagging>",
                 "Content-Type": content_type,
             }
             conditions = [dict([field]) for field in fields.items()]
+            # boto3 does not mutate these structures, so they can be passed
+            # as-is - no need to deepcopy them per presign request
             sign_url_response = self.client.generate_presigned_post(
                 bucket_name,
                 key,
-                Fields=copy.deepcopy(fields),
-                Conditions=copy.deepcopy(conditions),
+                Fields=fields,
+                Conditions=conditions,
                 ExpiresIn=expiration,
             )
         except botocore.exceptions.ClientError as exc:
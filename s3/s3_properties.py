@@ -1,6 +1,8 @@
 """This module contains the operation handlers for Amazon S3 access through Boto3 specific to tags
 
 """
+import re
+import urllib.parse
 from typing import Optional
 import botocore.exceptions
 
@@ -12,10 +14,36 @@ from . import helpers
 
 logger = logging.getLogger(__name__)
 
+# single-pass alternation instead of one substring scan per base64 key
+_B64_RE = re.compile("|".join(re.escape(tag) for tag in constants.KEY_TAGS_USING_BASE64))
+
+
+def tags_to_querystring(tag_list):
+    """URL-encode an S3 tag list for the inline PutObject Tagging parameter
+
+    Args:
+        tag_list (list): list of Key/Value dicts as produced by
+            MediaTagging.create_s3_tags
+
+    Returns:
+        string: URL-encoded ``key=value&...`` form of the tags
+    """
+    return urllib.parse.urlencode([(tag["Key"], tag["Value"]) for tag in tag_list])
+
 
 class MediaTagging:
     """Base class that all S3 access point implementations derive from"""
 
+    # class-level cache - boto3 client creation is expensive and these
+    # objects are instantiated per tagged put/get, so share one client
+    _client = None
+
+    @classmethod
+    def _get_client(cls):
+        if cls._client is None:
+            cls._client = default_client().get_client_s3()
+        return cls._client
+
     def __init__(self, bucket_name, key):
         """Initialize MediaTagging class and setting up buckets
 
@@ -24,27 +52,10 @@ class MediaTagging:
             key (str): key of the object
 
         """
-        self.client = default_client().get_client_s3()
+        self.client = self._get_client()
         self.bucket_name = bucket_name
         self.key = key
-        self.key_tags_using_base64 = ["description", "brand", "category"]
-
-    def _iter_aggregated_tag(self, tag_key, tag_value):
-        """Iterate tags that has been combined
-
-        Args:
-            tag_key (str): key of the tag
-            tag_value (str): value of the tag
-
-        Returns:
-            tuple: key and tag
-
-        """
-        for key_value in zip(
-            tag_key.split(constants.MEDIA_TAG_KEY_SEPARATOR),
-            tag_value.split(constants.MEDIA_TAG_VALUE_SEPARATOR),
-        ):
-            yield key_value[0], key_value[1]
+        self.key_tags_using_base64 = frozenset({"description", "brand", "category"})
 
     def _update_aggregated(
         self,
@@ -69,6 +80,7 @@ class MediaTagging:
         Returns:
             A tuple of values corresponding to sub-tags.
         """
+        base64_decode = helpers.base64_decode
         sub_tags_values = []
         sub_tags_old_values = sub_tags_old_aggregated_values and sub_tags_old_aggregated_values.split(
             constants.MEDIA_TAG_VALUE_SEPARATOR
@@ -78,7 +90,7 @@ class MediaTagging:
                 old_sub_tag_value = sub_tags_old_values and sub_tags_old_values[index] or ""
 
                 if are_old_values_b64_encoded and old_sub_tag_value != "":
-                    old_sub_tag_value = helpers.base64_decode(old_sub_tag_value)
+                    old_sub_tag_value = base64_decode(old_sub_tag_value)
 
                 sub_tags_values.append(old_sub_tag_value)
             else:
@@ -95,7 +107,7 @@ class MediaTagging:
         >>> self._are_sub_tags_b64_encoded('resolutionInPx_resolutionKey')
         False
         """
-        return any(tag in key for tag in constants.KEY_TAGS_USING_BASE64)
+        return bool(_B64_RE.search(key))
 
     def update(self, **tags):
         """Update tags of an object.
@@ -130,16 +142,33 @@ class MediaTagging:
             A dictionary containing the tags.
         """
         response = self.client.get_object_tagging(Bucket=self.bucket_name, Key=self.key)
+        return self._tags_from_tag_set(response["TagSet"], separate_aggregated)
+
+    def _tags_from_tag_set(self, tag_set, separate_aggregated):
+        """Convert an S3 TagSet list back into a tag dictionary
+
+        Args:
+            tag_set (list): list of Key/Value dicts as used by the S3 tagging APIs
+            separate_aggregated (bool): if the aggregated tags needs to be separated to a separate key pair
+
+        Returns:
+            A dictionary containing the tags.
+        """
         tags = {}
-        for tag_dict in response["TagSet"]:
-            if constants.MEDIA_TAG_KEY_SEPARATOR in tag_dict["Key"] and separate_aggregated:
-                for key, value in self._iter_aggregated_tag(tag_dict["Key"], tag_dict["Value"]):
-                    tags[key] = value
+        key_separator = constants.MEDIA_TAG_KEY_SEPARATOR
+        value_separator = constants.MEDIA_TAG_VALUE_SEPARATOR
+        b64_keys = self.key_tags_using_base64
+        base64_decode = helpers.base64_decode
+        for tag_dict in tag_set:
+            tag_key = tag_dict["Key"]
+            if key_separator in tag_key and separate_aggregated:
+                # one split per side; decode happens while the pairs are
+                # inserted, so the dict is only walked once
+                for key, value in zip(tag_key.split(key_separator), tag_dict["Value"].split(value_separator)):
+                    tags[key] = base64_decode(value) if key in b64_keys else value
             else:
-                tags[tag_dict["Key"]] = tag_dict["Value"]
-        for key in tags:
-            if key in self.key_tags_using_base64:
-                tags[key] = helpers.base64_decode(tags[key])
+                value = tag_dict["Value"]
+                tags[tag_key] = base64_decode(value) if tag_key in b64_keys else value
         return tags
 
     def put(self, **tags):
@@ -148,6 +177,9 @@ class MediaTagging:
         Args:
             tags (kwargs): new tags of an object
 
+        Returns:
+            A dictionary with the stored tags, decoded from the tag list that
+            was just written - saves callers a get_object_tagging round trip.
         """
         logger.debug(f"Creating s3 tags: {tags}")
         tag_list = self.create_s3_tags(**tags)
@@ -155,6 +187,32 @@ class MediaTagging:
         logger.debug(f"Tag list: {tag_list}")
         response = self.client.put_object_tagging(Bucket=self.bucket_name, Key=self.key, Tagging={"TagSet": tag_list})
         logger.debug(f'client.put_object_tagging->HTTPStatusCode: {response["ResponseMetadata"]["HTTPStatusCode"]}')
+        return self._tags_from_tag_set(tag_list, separate_aggregated=True)
+
+    def _encode_value(self, key, value):
+        """Encode a single tag value into its stored S3 form
+
+        Args:
+            key (str): key of the tag
+            value: raw value; a tuple matching an aggregated key is joined
+                with the value separator
+
+        Returns:
+            string: encoded tag value
+        """
+        if isinstance(value, tuple) and key.count(constants.MEDIA_TAG_KEY_SEPARATOR) == len(value) - 1:
+            keys = key.split(constants.MEDIA_TAG_KEY_SEPARATOR)
+            joined_value = []
+            for sub_key, sub_value in zip(keys, value):
+                if not sub_value:
+                    sub_value = ""
+                if sub_key in constants.KEY_TAGS_USING_BASE64:
+                    sub_value = helpers.base64_encode(sub_value)
+                joined_value.append(sub_value)
+            return constants.MEDIA_TAG_VALUE_SEPARATOR.join(joined_value)
+        if key in constants.KEY_TAGS_USING_BASE64:
+            return helpers.base64_encode(value)
+        return str(value)
 
     def create_s3_tags(self, **tags):
         """Generate final form of s3 Tags
@@ -165,30 +223,20 @@ class MediaTagging:
         Returns:
             string: extension
         """
-        tag_list = []
-        for key, value in tags.items():
-            if isinstance(value, tuple) and key.count(constants.MEDIA_TAG_KEY_SEPARATOR) == len(value) - 1:
-                keys = key.split(constants.MEDIA_TAG_KEY_SEPARATOR)
-                joined_value = []
-                for sub_key, sub_value in zip(keys, value):
-                    if not sub_value:
-                        sub_value = ""
-                    if sub_key in constants.KEY_TAGS_USING_BASE64:
-                        sub_value = helpers.base64_encode(sub_value)
-                    joined_value.append(sub_value)
-                value = constants.MEDIA_TAG_VALUE_SEPARATOR.join(joined_value)
-            elif key in constants.KEY_TAGS_USING_BASE64:
-                value = helpers.base64_encode(value)
-            else:
-                value = str(value)
-            tag_list.append(dict(Key=key, Value=value))
-
-        return tag_list
+        return [{"Key": key, "Value": self._encode_value(key, value)} for key, value in tags.items()]
 
 
 class ObjectMetadata:
     """Base class that all S3 access point implementations derive from"""
 
+    _client = None
+
+    @classmethod
+    def _get_client(cls):
+        if cls._client is None:
+            cls._client = default_client().get_client_s3()
+        return cls._client
+
     def __init__(self, bucket_name, key):
         """Initialize ObjectMetadata class and setting up buckets
 
@@ -197,7 +245,7 @@ class ObjectMetadata:
             key (str): key of the object
 
         """
-        self.client = default_client().get_client_s3()
+        self.client = self._get_client()
         self.bucket_name = bucket_name
         self.key = key
 
@@ -5,8 +5,16 @@
 
 """
 import os
-import json
 import time
+import atexit
+import functools
+import itertools
+import collections
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .aws import SQSQueue
 from . import helpers
@@ -18,6 +26,142 @@ from . import apirequest
 logger = logging.getLogger(__name__)
 _SQS_QUEUE_SPLUNK_LOGS = None
 
+# immutable after bootstrap - read the environment once at import
+_NAMESPACE = os.environ.get("BALDENEY_NAMESPACE", "")
+
+# orjson serializes at C level and only consults the default callable for
+# types it cannot handle natively, so the custom encoder's Python path runs
+# far less often; the stdlib encoder stays as fallback
+_json_encoder_default = helpers.JSONEncoder().default
+
+if orjson is not None:
+
+    def _json_dumps(data):
+        # bytes stay bytes until the boto3 boundary - see _as_message_body
+        return orjson.dumps(data, default=_json_encoder_default)
+
+else:
+    # one shared encoder instead of the fresh context json.dumps builds per
+    # call; compact separators shave whitespace bytes off every SQS body
+    _STDLIB_ENCODER = helpers.JSONEncoder(separators=(",", ":"))
+
+    def _json_dumps(data):
+        return _STDLIB_ENCODER.encode(data)
+
+
+class _TooBig(Exception):
+    """Raised by _CountingWriter once the size limit is crossed."""
+
+
+class _CountingWriter:
+    """Chunk sink for iterencode that aborts past a size limit
+
+    Keeps the chunks seen so far, so the over-limit path can reuse them as
+    the truncation prefix - memory stays capped near the limit instead of
+    materializing the whole oversized dump.
+    """
+
+    __slots__ = ("limit", "length", "chunks")
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.length = 0
+        self.chunks = []
+
+    def write(self, chunk):
+        self.length += len(chunk)
+        self.chunks.append(chunk)
+        if self.length > self.limit:
+            raise _TooBig
+
+
+# headroom under the 256KB SQS body cap for request overhead
+_SQS_BODY_SIZE_BUDGET = 240 * 1024
+_EVENTS_PREFIX = '{"events":['
+_EVENTS_SUFFIX = "]}"
+
+
+def _pack_event_bodies(bodies):
+    """Folds serialized events bodies into fewer, larger SQS bodies
+
+    Works purely on the already-serialized compact form: the inner event
+    arrays are sliced out of their ``{"events":[...]}`` envelopes and joined
+    with commas, so nothing is parsed or re-encoded. A combined body is
+    sealed once adding the next would push it over the size budget.
+
+    Args:
+        bodies (list): serialized bodies as produced by _json_dumps
+
+    Returns:
+        list: combined message body strings
+    """
+    packed = []
+    parts = []
+    size = 0
+    envelope = len(_EVENTS_PREFIX) + len(_EVENTS_SUFFIX)
+    for body in bodies:
+        body = _as_message_body(body)
+        if not (body.startswith(_EVENTS_PREFIX) and body.endswith(_EVENTS_SUFFIX)):
+            # unexpected shape - pass it through untouched
+            packed.append(body)
+            continue
+        inner = body[len(_EVENTS_PREFIX) : -len(_EVENTS_SUFFIX)]
+        if parts and size + len(inner) + 1 + envelope > _SQS_BODY_SIZE_BUDGET:
+            packed.append(_EVENTS_PREFIX + ",".join(parts) + _EVENTS_SUFFIX)
+            parts = []
+            size = 0
+        parts.append(inner)
+        size += len(inner) + 1
+    if parts:
+        packed.append(_EVENTS_PREFIX + ",".join(parts) + _EVENTS_SUFFIX)
+    return packed
+
+
+def _as_message_body(body):
+    # boto3 requires str for MessageBody; one decode of orjson's bytes here
+    # is cheaper than carrying a decoded str through every buffer
+    return body.decode() if isinstance(body, bytes) else body
+
+
+def _trim_business_data(business_data, limit):
+    """Returns the truncation prefix when the serialized size exceeds limit
+
+    Args:
+        business_data (dict): event payload to measure
+        limit (int): maximum serialized size in characters
+
+    Returns:
+        str or None: first ``limit`` characters of the dump when oversized,
+        None when the payload fits
+    """
+    # report-style payloads are flat and small; when this rough estimate
+    # stays well under the limit, the measuring dump is skipped entirely
+    # (the outer dump still serializes the real thing). repr length only
+    # tracks encoded length for ASCII - the encoders escape non-ASCII to
+    # multi-byte sequences - so anything non-ASCII takes the real check
+    estimate = 0
+    ascii_only = True
+    for key, value in business_data.items():
+        value_repr = repr(value)
+        ascii_only = ascii_only and key.isascii() and value_repr.isascii()
+        estimate += len(key) + len(value_repr) + 4
+    if ascii_only and estimate < limit // 2:
+        return None
+    if orjson is not None:
+        # orjson measures in one C-level pass; streaming buys nothing there
+        dump = _json_dumps(business_data)
+        if len(dump) <= limit:
+            return None
+        # ignore a code point the byte slice may have cut in half
+        return dump[:limit].decode("utf-8", errors="ignore")
+    writer = _CountingWriter(limit)
+    try:
+        for chunk in _STDLIB_ENCODER.iterencode(business_data):
+            writer.write(chunk)
+    except _TooBig:
+        return "".join(writer.chunks)[:limit]
+    return None
+
 
 def splunk_logs_queue():
     global _SQS_QUEUE_SPLUNK_LOGS
@@ -26,9 +170,31 @@ def splunk_logs_queue():
     return _SQS_QUEUE_SPLUNK_LOGS
 
 
+# sends issued outside a collector context manager coalesce here, so even
+# stray one-off messages amortize the SQS round trip across a batch
+_PENDING_MESSAGES = collections.deque()
+
+
+def _flush_pending_messages():
+    while _PENDING_MESSAGES:
+        entries = []
+        while _PENDING_MESSAGES and len(entries) < constants.SQS_QUEUE_SPLUNK_MESSAGE_MAX_BATCH_SIZE:
+            entries.append({"Id": f"id_{len(entries)}", "MessageBody": _as_message_body(_PENDING_MESSAGES.popleft())})
+        response = splunk_logs_queue().send_messages(Entries=entries)
+        if response.get("Failed"):
+            logger.error(response)
+
+
+atexit.register(_flush_pending_messages)
+
+
 class LambdaEventContext:
     """Base class that all Lambda Event Context implementations derive from"""
 
+    # fixed attribute set per invocation - slot descriptors beat the
+    # per-instance __dict__ hash lookups on the hot send paths
+    __slots__ = ("event", "context", "_ctx_snapshot", "_remaining_ms", "_legible")
+
     def __init__(self, event, context):
         """Initialize MediaTagging class
 
@@ -39,6 +205,20 @@ class LambdaEventContext:
         """
         self.event = event
         self.context = context
+        # context attributes cannot change mid-invocation; extract them once
+        # here instead of per message via getattr-with-fallback chains
+        self._ctx_snapshot = dict(
+            functionName=getattr(context, "function_name", ""),
+            invokedFunctionArn=getattr(context, "invoked_function_arn", ""),
+            logGroupName=getattr(context, "log_group_name", ""),
+            logStreamName=getattr(context, "log_stream_name", ""),
+            memoryLimitInMB=getattr(context, "memory_limit_in_mb", ""),
+        )
+        remaining_ms = getattr(context, "get_remaining_time_in_millis", None)
+        # one fallback lambda per instance, not one per message
+        self._remaining_ms = remaining_ms if remaining_ms is not None else (lambda: 0)
+        # legibility cannot change during an invocation - decide it once
+        self._legible = bool(context and getattr(context, "aws_request_id", ""))
 
     def is_legible(self):
         """Checks if Lambda Event is eligible for Splunk logging
@@ -47,9 +227,7 @@ class LambdaEventContext:
             bool: True if Lambda has context
 
         """
-        if self.context and getattr(self.context, "aws_request_id", ""):
-            return True
-        return False
+        return self._legible
 
 
 class EventCollector(LambdaEventContext):
@@ -58,6 +236,8 @@ class EventCollector(LambdaEventContext):
 
     """
 
+    __slots__ = ("_buffering_messages", "_buffered_messages", "_static_fields")
+
     def __init__(self, event, context=None):
         """Initialize EventCollector class
 
@@ -69,6 +249,24 @@ class EventCollector(LambdaEventContext):
         super().__init__(event, context)
         self._buffering_messages = False
         self._buffered_messages = []
+        # everything below is invariant for the lifetime of this collector,
+        # so snapshot it once instead of rebuilding it per message
+        event_get = event.get
+        self._static_fields = dict(
+            # meta data
+            contentVersion=constants.SPLUNK_CONTENT_VERSION,
+            # system related
+            host=event_get("headers", {}).get("Host", ""),
+            namespace=_NAMESPACE,
+            # location related
+            uriPath=event_get("path"),
+            uriResource=event_get("resource"),
+            uriPathParameters=event_get("pathParameters"),
+            uriQueryStringParameters=event_get("queryStringParameters"),
+            requestContext=event_get("requestContext"),
+            # function related
+            **self._ctx_snapshot,
+        )
 
     def __enter__(self):
         self._buffering_messages = True
@@ -77,6 +275,7 @@ class EventCollector(LambdaEventContext):
     def __exit__(self, type_, value, traceback):
         # return of not True forces any exception between enter and exit to be re-raised.
         self._send_buffered_messages()
+        self._buffering_messages = False
 
     def send_prepared_messages(self, *prepared_data):
         if not self.is_legible():
@@ -99,34 +298,75 @@ class EventCollector(LambdaEventContext):
             return False
         return self._send_prepared_data({"events": [self._prepare_data(**business_data)]})
 
+    def send_message_dict(self, business_data) -> bool:
+        """Push one pre-built business-data dict to SQS.
+
+        Skips the kwargs pack/unpack round trip send_message pays for
+        callers that already hold the event as a dict.
+
+        Args:
+            business_data (dict): the real data of the event.
+
+        Returns:
+            success_flag (bool)
+
+        """
+        if not self.is_legible():
+            return False
+        return self._send_prepared_data({"events": [self._prepare_data_dict(business_data)]})
+
+    def send_messages(self, business_data_list) -> bool:
+        """Push several events to SQS as one message.
+
+        One events array carrying N entries costs a single serialization and
+        a single SQS send, where N send_message calls would pay both N times.
+
+        Args:
+            business_data_list (list): one business-data dict per event.
+
+        Returns:
+            success_flag (bool)
+
+        """
+        if not self.is_legible():
+            return False
+        return self._send_prepared_data(
+            {"events": [self._prepare_data_dict(business_data) for business_data in business_data_list]}
+        )
+
     def _send_prepared_data(self, data):
         for event in data["events"]:
-            if (
-                len(json.dumps(event["businessData"], cls=helpers.JSONEncoder))
-                > constants.SPLUNK_BUSINESS_DATA_MAX_SIZE
-            ):
-                long_business_data = json.dumps(event.pop("businessData"), cls=helpers.JSONEncoder)
+            trimmed = _trim_business_data(event["businessData"], constants.SPLUNK_BUSINESS_DATA_MAX_SIZE)
+            if trimmed is not None:
                 event["businessData"] = dict(
-                    trimmed_business_data=long_business_data[: constants.SPLUNK_BUSINESS_DATA_MAX_SIZE],
+                    trimmed_business_data=trimmed,
                     error_message="Business data too long",
                 )
 
-        data_dump = json.dumps(data, cls=helpers.JSONEncoder)
+        data_dump = _json_dumps(data)
         if self._buffering_messages:
             self._buffered_messages.append(data_dump)
             return True
-        sqs_response = splunk_logs_queue().send_message(MessageBody=data_dump)
-        if sqs_response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 200:
-            logger.warning(sqs_response)
-            return False
+        # non-context-manager sends no longer go out one message per API
+        # call; they queue up and flush as a full SendMessageBatch. a
+        # timer-driven flush does not fit Lambda (threads freeze between
+        # invocations), so the remainder drains at the next full batch,
+        # the next buffered flush or interpreter exit
+        _PENDING_MESSAGES.append(data_dump)
+        if len(_PENDING_MESSAGES) >= constants.SQS_QUEUE_SPLUNK_MESSAGE_MAX_BATCH_SIZE:
+            _flush_pending_messages()
         return True
 
     def _send_buffered_messages(self):
-        batches = [
-            self._buffered_messages[i : i + constants.SQS_QUEUE_SPLUNK_MESSAGE_MAX_BATCH_SIZE]
-            for i in range(0, len(self._buffered_messages), constants.SQS_QUEUE_SPLUNK_MESSAGE_MAX_BATCH_SIZE)
-        ]
-        for batch in batches:
+        # small bodies merge into combined events arrays first, then go out
+        # ten entries per SendMessageBatch; draining the buffer here keeps
+        # the collector reusable for the next buffered episode
+        bodies = iter(_pack_event_bodies(self._buffered_messages))
+        self._buffered_messages = []
+        max_batch_size = constants.SQS_QUEUE_SPLUNK_MESSAGE_MAX_BATCH_SIZE
+        # islice consumes the bodies lazily - no up-front list of slice
+        # copies, and nothing is allocated for batches never reached
+        while batch := list(itertools.islice(bodies, max_batch_size)):
             entries = [
                 {
                     "Id": f"id_{i}",
@@ -137,6 +377,8 @@ class EventCollector(LambdaEventContext):
             response = splunk_logs_queue().send_messages(Entries=entries)
             if response.get("Failed"):
                 logger.error(response)
+        # piggyback any stray unbatched sends on the buffered flush
+        _flush_pending_messages()
 
     def _prepare_data(self, **business_data):
         """Returns a dictionary of data that will be sent to splunk
@@ -144,31 +386,28 @@ class EventCollector(LambdaEventContext):
         Args:
             business_data (kwargs): the real data of the event
 
+        Returns:
+            dict: prepared data containing the business data
+        """
+        return self._prepare_data_dict(business_data)
+
+    def _prepare_data_dict(self, business_data):
+        """Returns a dictionary of data that will be sent to splunk
+
+        Args:
+            business_data (dict): the real data of the event
+
         Returns:
             dict: prepared data containing the business data
         """
         return dict(
-            # user data
-            businessData=dict(business_data),
-            # meta data
-            contentVersion=constants.SPLUNK_CONTENT_VERSION,
-            # system related
-            host=self.event.get("headers", {}).get("Host", ""),
-            namespace=os.environ.get("BALDENEY_NAMESPACE", ""),
-            # location related
-            uriPath=self.event.get("path"),
-            uriResource=self.event.get("resource"),
-            uriPathParameters=self.event.get("pathParameters"),
-            uriQueryStringParameters=self.event.get("queryStringParameters"),
-            requestContext=self.event.get("requestContext"),
-            # function related
-            remainingTimeInMiliseconds=getattr(self.context, "get_remaining_time_in_millis", lambda: 0)(),
+            # user data - goes straight into the JSON dump, so no defensive
+            # copy is needed
+            businessData=business_data,
+            # only the genuinely per-message fields are computed here
+            remainingTimeInMiliseconds=self._remaining_ms(),
             localEpochtimeInMiliseconds=int(time.time() * 1000),
-            functionName=getattr(self.context, "function_name", ""),
-            invokedFunctionArn=getattr(self.context, "invoked_function_arn", ""),
-            logGroupName=getattr(self.context, "log_group_name", ""),
-            logStreamName=getattr(self.context, "log_stream_name", ""),
-            memoryLimitInMB=getattr(self.context, "memory_limit_in_mb", ""),
+            **self._static_fields,
         )
 
 
@@ -201,6 +440,26 @@ class SplunkClient:
         return return_value
 
 
+def _auto_buffer(method):
+    """Runs a report method inside the collector's buffering context
+
+    Report episodes are inherently multi-message; buffering forces their
+    sends to coalesce into one SendMessageBatch even when the caller did not
+    open the context manager themselves. Already-buffering collectors pass
+    straight through.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        collector = getattr(self, "splunk_collector", None)
+        if collector and not collector._buffering_messages:
+            with collector:
+                return method(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class FotoFlowMixin:
     """Base class that all FotoFlowMixin implementations derive from
     These are implementation exclusive for FotoFlow to send events to splunk.
@@ -219,6 +478,7 @@ class FotoFlowMixin:
         """
         self.splunk_collector = collector
 
+    @_auto_buffer
     def report_new_container(self, response, **business_data):
         """Send a report when a new container is created
 
@@ -226,12 +486,15 @@ class FotoFlowMixin:
             response (dict): response of the main lambda call
             business_data (kwargs): data to be sent
         """
-        self.splunk_collector.send_message(
-            comment="Container Level Log",
-            statusCode=response.get_status_code(),
-            **business_data,
+        self.splunk_collector.send_message_dict(
+            dict(
+                comment="Container Level Log",
+                statusCode=response.get_status_code(),
+                **business_data,
+            )
         )
 
+    @_auto_buffer
     def report_add_article(self, response, item, gtin, article_stage):
         """Send a report when a new article is added
 
@@ -241,16 +504,19 @@ class FotoFlowMixin:
             gtin (str): gtin of the article
             article_stage (str): stage of the article
         """
-        self.splunk_collector.send_message(
-            gtin=gtin,
-            articleStage=article_stage,
-            containerStage=item["containerStage"],
-            channel=item["channel"],
-            containerKey=item["containerKey"],
-            modelKey=item.get("modelKey", ""),
-            statusCode=response.get_status_code(),
+        self.splunk_collector.send_message_dict(
+            dict(
+                gtin=gtin,
+                articleStage=article_stage,
+                containerStage=item["containerStage"],
+                channel=item["channel"],
+                containerKey=item["containerKey"],
+                modelKey=item.get("modelKey", ""),
+                statusCode=response.get_status_code(),
+            )
         )
 
+    @_auto_buffer
     def report_delete_article(self, response, item, gtin, article_stage):
         """Send a report when an article is deleted
 
@@ -260,16 +526,19 @@ class FotoFlowMixin:
             gtin (str): gtin of the article
             article_stage (str): stage of the article
         """
-        self.splunk_collector.send_message(
-            gtin=gtin,
-            articleStage=article_stage,
-            containerStage=item["containerStage"],
-            channel=item["channel"],
-            containerKey=item["containerKey"],
-            modelKey=item.get("modelKey", ""),
-            statusCode=response.get_status_code(),
+        self.splunk_collector.send_message_dict(
+            dict(
+                gtin=gtin,
+                articleStage=article_stage,
+                containerStage=item["containerStage"],
+                channel=item["channel"],
+                containerKey=item["containerKey"],
+                modelKey=item.get("modelKey", ""),
+                statusCode=response.get_status_code(),
+            )
         )
 
+    @_auto_buffer
     def report_delete_all_articles(self, response, item, gtins, container_stage):
         """Send a report when an all article are deleted
 
@@ -282,26 +551,34 @@ class FotoFlowMixin:
         # TODO: container_stage should be removed
         if not self.splunk_collector:
             return
-        for gtin in gtins:
-            self.splunk_collector.send_message(
+        status_code = response.get_status_code()
+        model_key = item.get("modelKey", "")
+        events = [
+            dict(
                 comment="sub-procedure deleting all articles triggered",
                 gtin=gtin,
                 articleStage=item["containerStage"],
                 containerStage=item["containerStage"],
                 channel=item["channel"],
                 containerKey=item["containerKey"],
-                modelKey=item.get("modelKey", ""),
-                statusCode=response.get_status_code(),
+                modelKey=model_key,
+                statusCode=status_code,
+            )
+            for gtin in gtins
+        ]
+        events.append(
+            dict(
+                comment="Container Level Log",
+                containerStage=item["containerStage"],
+                channel=item["channel"],
+                containerKey=item["containerKey"],
+                modelKey=model_key,
+                statusCode=status_code,
             )
-        self.splunk_collector.send_message(
-            comment="Container Level Log",
-            containerStage=item["containerStage"],
-            channel=item["channel"],
-            containerKey=item["containerKey"],
-            modelKey=item.get("modelKey", ""),
-            statusCode=response.get_status_code(),
         )
+        self.splunk_collector.send_messages(events)
 
+    @_auto_buffer
     def report_change_articles(self, response, item, back_from_waiting_stage):
         """Send a report when article has been updated
 
@@ -314,22 +591,29 @@ class FotoFlowMixin:
             # don't report if moving back to previous container stage
             return
         wait_stage = "wait" in item["containerStage"].lower()
-        for key, value in item["articles"].items():
-            self.splunk_collector.send_message(
+        status_code = response.get_status_code()
+        model_key = item.get("modelKey", "")
+        events = [
+            dict(
                 gtin=key,
                 articleStage=wait_stage and item["containerStage"] or value["articleStage"],
                 containerStage=item["containerStage"],
                 channel=item["channel"],
                 containerKey=item["containerKey"],
-                modelKey=item.get("modelKey", ""),
-                statusCode=response.get_status_code(),
+                modelKey=model_key,
+                statusCode=status_code,
+            )
+            for key, value in item["articles"].items()
+        ]
+        events.append(
+            dict(
+                comment="Container Level Log",
+                backFromWaitingStage=back_from_waiting_stage,
+                containerStage=item["containerStage"],
+                channel=item["channel"],
+                containerKey=item["containerKey"],
+                modelKey=model_key,
+                statusCode=status_code,
             )
-        self.splunk_collector.send_message(
-            comment="Container Level Log",
-            backFromWaitingStage=back_from_waiting_stage,
-            containerStage=item["containerStage"],
-            channel=item["channel"],
-            containerKey=item["containerKey"],
-            modelKey=item.get("modelKey", ""),
-            statusCode=response.get_status_code(),
         )
+        self.splunk_collector.send_messages(events)
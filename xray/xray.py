@@ -3,10 +3,21 @@ from typing import Any, Callable, Dict, Optional, Union
 import functools
 import json
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from common import logging
 
 logger = logging.getLogger("core")
 
+# X-Ray rejects metadata blobs above 64K - only bodies near that bound are
+# worth parsing and truncating at all
+_METADATA_SIZE_LIMIT = 64 * 1024
+
 
 class XRay(Tracer):
     request_id: str = None
@@ -31,13 +42,16 @@ class XRay(Tracer):
                 subsegment.put_annotation(key="request_id", value=self.request_id)
                 subsegment.put_annotation(key="lambda_name", value=function_name)
                 subsegment.put_metadata(key="identity", value=event.get("requestContext", {}).get("identity"))
-                request_body = json.loads(event.get("body", "{}"))
-
-                # because X-RAY accept only metadata less than 64K
-                if truncate and "articles" in request_body.keys() and len(request_body["articles"]) > 10:
-                    request_body["articles"] = request_body["articles"][:10]
-
-                subsegment.put_metadata(key="request_body", value=request_body)
+                raw_body = event.get("body", "{}")
+                if truncate and len(raw_body) > _METADATA_SIZE_LIMIT:
+                    request_body = _json_loads(raw_body)
+                    if "articles" in request_body and len(request_body["articles"]) > 10:
+                        request_body["articles"] = request_body["articles"][:10]
+                    subsegment.put_metadata(key="request_body", value=request_body)
+                else:
+                    # the raw string is valid metadata as-is; skipping the
+                    # decode also spares powertools re-encoding the dict
+                    subsegment.put_metadata(key="request_body", value=raw_body)
                 try:
                     response = lambda_handler(event, context, **kwargs)
                 except Exception as err:
@@ -48,11 +62,9 @@ class XRay(Tracer):
         return decorate
 
 
-_tracer = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_tracer():
-    global _tracer
-    if not _tracer:
-        _tracer = XRay(service="articlelake")
-    return _tracer
+    # lru_cache is C-implemented and atomic per call, so concurrent warm
+    # starts cannot race two XRay constructions like the old module-global
+    # check-then-set could
+    return XRay(service="articlelake")